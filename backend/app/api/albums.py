@@ -1,32 +1,28 @@
 import os
 
 from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session
+from fastapi.responses import FileResponse, Response
+from sqlalchemy.orm import Session, selectinload
 from typing import Optional, List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models import Album, Track, MatchCandidate, ActivityLog, TagBackup, TrackTagSnapshot
 from app.schemas import (
-    AlbumSummary, AlbumDetail, AlbumListResponse,
+    AlbumSummary, AlbumDetail, AlbumListResponse, album_to_summary,
     TagRequest, ScanRequest, TrackResponse, MatchCandidateResponse,
     BatchActionRequest,
     ArtworkOptionResponse, ArtworkDiscoveryResponse, ApplyArtworkRequest,
     TagBackupResponse, ManualTagEditRequest, BulkManualTagEditRequest,
 )
 from app.core.audio_reader import read_track
-from app.core.artwork_discovery import (
-    discover_caa, discover_itunes, discover_fanarttv, discover_filesystem,
-)
-from app.core.artwork_fetcher import _download_image, save_artwork_to_folder
 from app.core.tagger import write_tags, TagData
 from app.core.tag_backup import read_full_tags, create_backup, restore_backup, delete_backup
-from app.services.album_scanner import scan_directory
-from app.services.queue_manager import queue_manager
 from app.utils.logger import log
 
 router = APIRouter()
 
+_ALBUM_SUMMARY_COLUMNS = tuple(getattr(Album, name) for name in AlbumSummary.model_fields)
+
 
 @router.get("", response_model=AlbumListResponse)
 def list_albums(
@@ -35,9 +31,9 @@ def list_albums(
     limit: int = 50,
     offset: int = 0,
     sort: str = "updated_desc",
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
-    query = db.query(Album)
+    query = db.query(*_ALBUM_SUMMARY_COLUMNS)
 
     if status:
         query = query.filter(Album.status == status)
@@ -61,19 +57,26 @@ def list_albums(
     }
     query = query.order_by(sort_map.get(sort, Album.updated_at.desc()))
 
-    albums = query.offset(offset).limit(limit).all()
+    rows = query.offset(offset).limit(limit).all()
 
-    return AlbumListResponse(
-        items=[AlbumSummary.model_validate(a) for a in albums],
+    # Rows come straight from the albums table, so skip per-field validation
+    # and let pydantic-core encode the page directly instead of going
+    # through jsonable_encoder.
+    page = AlbumListResponse(
+        items=[album_to_summary(row) for row in rows],
         total=total,
         limit=limit,
         offset=offset,
     )
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{album_id}/artwork-options", response_model=ArtworkDiscoveryResponse)
-def get_artwork_options(album_id: int, db: Session = Depends(get_db)):
+def get_artwork_options(album_id: int, db: Session = Depends(get_read_db)):
     """Discover available artwork from all sources (thumbnails only, no download)."""
+    from app.core.artwork_discovery import (
+        discover_caa, discover_itunes, discover_fanarttv, discover_filesystem,
+    )
     album = db.query(Album).filter(Album.id == album_id).first()
     if not album:
         raise HTTPException(status_code=404, detail="Album not found")
@@ -137,6 +140,7 @@ def get_artwork_options(album_id: int, db: Session = Depends(get_db)):
 @router.post("/{album_id}/artwork")
 def apply_artwork(album_id: int, request: ApplyArtworkRequest, db: Session = Depends(get_db)):
     """Download selected artwork, save to folder, and embed in audio files."""
+    from app.core.artwork_fetcher import _download_image, save_artwork_to_folder
     album = db.query(Album).filter(Album.id == album_id).first()
     if not album:
         raise HTTPException(status_code=404, detail="Album not found")
@@ -165,12 +169,16 @@ def apply_artwork(album_id: int, request: ApplyArtworkRequest, db: Session = Dep
         album.cover_path = saved_path
 
     # Embed in all audio files (read-merge-write to preserve existing tags)
-    create_backup(db, album_id, "artwork")
     tracks = db.query(Track).filter(Track.album_id == album_id).all()
+    create_backup(db, album_id, "artwork", tracks=tracks)
     embedded = 0
     for track in tracks:
         existing = read_full_tags(track.path)
         if existing:
+            if existing.cover_data == image_data:
+                # Already embedded (e.g. re-applying the same cover); skip the rewrite
+                embedded += 1
+                continue
             existing.cover_data = image_data
             existing.cover_mime = mime
             if write_tags(track.path, existing):
@@ -191,7 +199,7 @@ def apply_artwork(album_id: int, request: ApplyArtworkRequest, db: Session = Dep
 
 
 @router.get("/{album_id}/tracks/{track_id}/tags")
-def get_track_tags(album_id: int, track_id: int, db: Session = Depends(get_db)):
+def get_track_tags(album_id: int, track_id: int, db: Session = Depends(get_read_db)):
     """Read current metadata tags directly from the audio file."""
     track = (
         db.query(Track)
@@ -228,7 +236,7 @@ def get_track_tags(album_id: int, track_id: int, db: Session = Depends(get_db)):
 
 
 @router.get("/{album_id}/cover")
-def get_album_cover(album_id: int, file: Optional[str] = None, db: Session = Depends(get_db)):
+def get_album_cover(album_id: int, file: Optional[str] = None, db: Session = Depends(get_read_db)):
     """Serve album cover art image from filesystem.
 
     If `file` is provided, serve that specific image file from the album folder.
@@ -271,8 +279,13 @@ def _guess_image_type(path: str) -> str:
 
 
 @router.get("/{album_id}", response_model=AlbumDetail)
-def get_album(album_id: int, db: Session = Depends(get_db)):
-    album = db.query(Album).filter(Album.id == album_id).first()
+def get_album(album_id: int, db: Session = Depends(get_read_db)):
+    album = (
+        db.query(Album)
+        .options(selectinload(Album.tracks), selectinload(Album.match_candidates))
+        .filter(Album.id == album_id)
+        .first()
+    )
     if not album:
         raise HTTPException(status_code=404, detail="Album not found")
 
@@ -291,6 +304,7 @@ def tag_album(
     request: TagRequest = TagRequest(),
     db: Session = Depends(get_db),
 ):
+    from app.services.queue_manager import queue_manager
     album = db.query(Album).filter(Album.id == album_id).first()
     if not album:
         raise HTTPException(status_code=404, detail="Album not found")
@@ -310,6 +324,7 @@ def retag_album(
     db: Session = Depends(get_db),
 ):
     """Re-tag an album (reset status and re-match)."""
+    from app.services.queue_manager import queue_manager
     album = db.query(Album).filter(Album.id == album_id).first()
     if not album:
         raise HTTPException(status_code=404, detail="Album not found")
@@ -357,6 +372,7 @@ def delete_album(album_id: int, db: Session = Depends(get_db)):
 @router.post("/batch/tag")
 def batch_tag(request: BatchActionRequest, db: Session = Depends(get_db)):
     """Queue multiple albums for tagging."""
+    from app.services.queue_manager import queue_manager
     queued = []
     for album_id in request.album_ids:
         album = db.query(Album).filter(Album.id == album_id).first()
@@ -371,6 +387,7 @@ def batch_tag(request: BatchActionRequest, db: Session = Depends(get_db)):
 @router.post("/batch/tag-pending")
 def batch_tag_pending(db: Session = Depends(get_db)):
     """Queue all untagged albums (pending + needs_review) for tagging."""
+    from app.services.queue_manager import queue_manager
     albums = db.query(Album).filter(Album.status.in_(["pending", "needs_review"])).all()
     queued = []
     for album in albums:
@@ -384,6 +401,7 @@ def batch_tag_pending(db: Session = Depends(get_db)):
 @router.post("/batch/retag-all")
 def batch_retag_all(db: Session = Depends(get_db)):
     """Reset ALL albums and re-queue them for matching + tagging."""
+    from app.services.queue_manager import queue_manager
     albums = db.query(Album).all()
     queued = []
     for album in albums:
@@ -418,7 +436,7 @@ def batch_skip(request: BatchActionRequest, db: Session = Depends(get_db)):
 # ─── Tag Backup & Restore ─────────────────────────────────────────
 
 @router.get("/{album_id}/backups", response_model=List[TagBackupResponse])
-def list_backups(album_id: int, db: Session = Depends(get_db)):
+def list_backups(album_id: int, db: Session = Depends(get_read_db)):
     """List all tag backups for an album."""
     album = db.query(Album).filter(Album.id == album_id).first()
     if not album:
@@ -669,7 +687,7 @@ def fetch_track_lyrics(album_id: int, track_id: int, db: Session = Depends(get_d
 
 
 @router.get("/{album_id}/tracks/{track_id}/lyrics")
-def get_track_lyrics(album_id: int, track_id: int, db: Session = Depends(get_db)):
+def get_track_lyrics(album_id: int, track_id: int, db: Session = Depends(get_read_db)):
     """Read lyrics from the audio file."""
     from app.core.lyrics_tagger import read_lyrics
 
@@ -770,5 +788,6 @@ def trigger_scan(
     request: ScanRequest = ScanRequest(),
     background_tasks: BackgroundTasks = BackgroundTasks(),
 ):
+    from app.services.album_scanner import scan_directory
     background_tasks.add_task(scan_directory, request.path, request.force)
     return {"message": "Scan started", "path": request.path, "force": request.force}
@@ -4,7 +4,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from typing import List
 
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models import Setting
 from app.schemas import SettingResponse, SettingsUpdateRequest
 from app.config import settings as app_settings
@@ -13,7 +13,7 @@ router = APIRouter()
 
 
 @router.get("", response_model=List[SettingResponse])
-def get_settings(db: Session = Depends(get_db)):
+def get_settings(db: Session = Depends(get_read_db)):
     return db.query(Setting).all()
 
 
@@ -3,16 +3,15 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from typing import List
 
-from app.database import get_db
+from app.database import get_read_db
 from app.models import Album, ActivityLog
 from app.schemas import StatsResponse, ActivityLogResponse
-from app.services.queue_manager import queue_manager
 
 router = APIRouter()
 
 
 @router.get("", response_model=StatsResponse)
-def get_stats(db: Session = Depends(get_db)):
+def get_stats(db: Session = Depends(get_read_db)):
     counts = (
         db.query(Album.status, func.count(Album.id))
         .group_by(Album.status)
@@ -28,6 +27,7 @@ def get_stats(db: Session = Depends(get_db)):
         .all()
     )
 
+    from app.services.queue_manager import queue_manager
     return StatsResponse(
         total_albums=sum(status_map.values()),
         tagged_count=status_map.get("tagged", 0),
@@ -46,7 +46,7 @@ def get_stats(db: Session = Depends(get_db)):
 def get_activity(
     limit: int = 50,
     offset: int = 0,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get activity log entries."""
     activities = (
@@ -3,10 +3,20 @@ from pydantic_settings import BaseSettings
 from typing import List
 
 
+DEFAULT_DISC_PATTERNS = (
+    r"^(?:cd|disc|disk)\s*(\d+)$",
+    r"^(?:(?:7|10|12)\s*(?:inch\s*)?)?vinyl\s*(\d+)$",
+    r"^side\s*([A-Da-d\d])$",
+    r"^cassette\s*(\d+)$",
+)
+
+
 class Settings(BaseSettings):
     music_dir: str = "/music"
     database_url: str = "sqlite:////data/autotagger.db"
     log_level: str = "INFO"
+    cache_index_html: bool = True
+    debug_sorted_scan: bool = False
 
     auto_tag_on_scan: bool = False
     confidence_auto_threshold: float = 85.0
@@ -19,6 +29,10 @@ class Settings(BaseSettings):
     ]
 
     watch_stabilization_delay: int = 30
+    # "auto" (filesystem events outside containers, polling inside),
+    # "events" or "poll"; read at startup
+    watch_mode: str = "auto"
+    watch_poll_interval: int = 60
 
     acoustid_api_key: str = ""
     fingerprint_enabled: bool = False
@@ -30,12 +44,7 @@ class Settings(BaseSettings):
     preferred_countries: List[str] = ["US", "GB", "DE", "IT"]
     preferred_media: List[str] = ["Digital Media", "CD"]
 
-    disc_subfolder_patterns: List[str] = [
-        r"^(?:cd|disc|disk)\s*(\d+)$",
-        r"^(?:(?:7|10|12)\s*(?:inch\s*)?)?vinyl\s*(\d+)$",
-        r"^side\s*([A-Da-d\d])$",
-        r"^cassette\s*(\d+)$",
-    ]
+    disc_subfolder_patterns: List[str] = list(DEFAULT_DISC_PATTERNS)
 
     # Backup settings
     backup_enabled: bool = True
@@ -163,7 +163,7 @@ def fetch_from_itunes(artist: str, album: str) -> Optional[Tuple[bytes, str]]:
 
     for score, result in scored:
         if score < 0.3:
-            log.debug(f"iTunes: skipping '{result.get('artistName')}' - '{result.get('collectionName')}' (score {score:.2f})")
+            log.debug("iTunes: skipping '%s' - '%s' (score %.2f)", result.get("artistName"), result.get("collectionName"), score)
             continue
 
         artwork_url = result.get("artworkUrl100", "")
@@ -287,7 +287,7 @@ def fetch_artwork(
         if not fetcher:
             continue
 
-        log.debug(f"Trying artwork source: {source_name}")
+        log.debug("Trying artwork source: %s", source_name)
         result = fetcher()
         if result:
             log.info(f"Artwork found from: {source_name}")
@@ -1,3 +1,4 @@
+import functools
 import os
 import re
 from dataclasses import dataclass, field
@@ -11,28 +12,45 @@ from mutagen.oggvorbis import OggVorbis
 from mutagen.oggopus import OggOpus
 from mutagen.id3 import ID3
 
+from app.config import DEFAULT_DISC_PATTERNS
 from app.utils.logger import log
 
-AUDIO_EXTENSIONS = {".flac", ".mp3", ".m4a", ".mp4", ".ogg", ".opus", ".wma"}
+AUDIO_EXTENSIONS = frozenset({".flac", ".mp3", ".m4a", ".mp4", ".ogg", ".opus", ".wma"})
 
-_disc_pattern_cache: list[re.Pattern] | None = None
 
+def is_audio_filename(name: str) -> bool:
+    """Whether a file name has an audio extension (cheaper than splitext)."""
+    i = name.rfind(".")
+    return i > 0 and name[i:].lower() in AUDIO_EXTENSIONS
 
-def _compile_disc_patterns() -> list[re.Pattern]:
-    """Compile disc subfolder patterns from settings, with caching."""
-    global _disc_pattern_cache
-    if _disc_pattern_cache is not None:
-        return _disc_pattern_cache
-    from app.config import settings
+_disc_pattern_cache: tuple[re.Pattern, ...] | None = None
+
+
+@functools.lru_cache(maxsize=4)
+def _compile_patterns(patterns: tuple[str, ...]) -> tuple[re.Pattern, ...]:
+    """Compile a set of disc subfolder patterns, skipping invalid ones."""
     compiled = []
-    for p in settings.disc_subfolder_patterns:
+    for p in patterns:
         if not p or not p.strip():
             continue
         try:
             compiled.append(re.compile(p, re.IGNORECASE))
         except re.error as e:
             log.warning(f"Invalid disc subfolder pattern {p!r}: {e}")
-    _disc_pattern_cache = compiled
+    return tuple(compiled)
+
+
+# Compile the built-in patterns once at import; most libraries never change them
+_compile_patterns(DEFAULT_DISC_PATTERNS)
+
+
+def _compile_disc_patterns() -> tuple[re.Pattern, ...]:
+    """Return compiled disc subfolder patterns from settings, with caching."""
+    global _disc_pattern_cache
+    if _disc_pattern_cache is not None:
+        return _disc_pattern_cache
+    from app.config import settings
+    _disc_pattern_cache = _compile_patterns(tuple(settings.disc_subfolder_patterns))
     return _disc_pattern_cache
 
 
@@ -40,6 +58,7 @@ def invalidate_disc_pattern_cache() -> None:
     """Reset the compiled disc pattern cache (call when settings change)."""
     global _disc_pattern_cache
     _disc_pattern_cache = None
+    is_disc_subfolder.cache_clear()
 
 
 @dataclass
@@ -257,14 +276,11 @@ def scan_album_folder(folder_path: str) -> Optional[AlbumInfo]:
         return None
 
     tracks: List[TrackInfo] = []
-    for filename in sorted(os.listdir(folder_path)):
-        ext = os.path.splitext(filename)[1].lower()
-        if ext not in AUDIO_EXTENSIONS:
-            continue
-        filepath = os.path.join(folder_path, filename)
-        if not os.path.isfile(filepath):
-            continue
-        track = read_track(filepath)
+    with os.scandir(folder_path) as it:
+        entries = [e for e in it if is_audio_filename(e.name) and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    for entry in entries:
+        track = read_track(entry.path)
         if track:
             tracks.append(track)
 
@@ -296,15 +312,18 @@ def _most_common(values: list):
 def has_audio_files(path: str) -> bool:
     """Check if a directory directly contains audio files."""
     try:
-        return any(
-            os.path.splitext(f)[1].lower() in AUDIO_EXTENSIONS
-            for f in os.listdir(path)
-            if os.path.isfile(os.path.join(path, f))
-        )
+        with os.scandir(path) as it:
+            return any(
+                is_audio_filename(e.name) and e.is_file()
+                for e in it
+            )
     except OSError:
         return False
 
 
+# Folder names repeat a lot across a library ("CD1", "Disc 1", ...); the
+# cache is cleared together with the compiled patterns.
+@functools.lru_cache(maxsize=2048)
 def is_disc_subfolder(name: str) -> Optional[int]:
     """Check if a folder name matches a disc pattern.
 
@@ -336,21 +355,43 @@ def find_disc_subfolders(folder_path: str) -> dict[int, str]:
     Returns {disc_number: subfolder_path} sorted by disc number,
     only for subfolders that contain audio files.
     """
-    if not os.path.isdir(folder_path):
+    try:
+        with os.scandir(folder_path) as it:
+            subdirs = [e for e in it if e.is_dir()]
+    except OSError:
         return {}
 
     result: dict[int, str] = {}
-    for entry in os.listdir(folder_path):
-        sub_path = os.path.join(folder_path, entry)
-        if not os.path.isdir(sub_path):
-            continue
-        disc_num = is_disc_subfolder(entry)
-        if disc_num is not None and has_audio_files(sub_path):
-            result[disc_num] = sub_path
+    for entry in subdirs:
+        disc_num = is_disc_subfolder(entry.name)
+        if disc_num is not None and has_audio_files(entry.path):
+            result[disc_num] = entry.path
 
     return dict(sorted(result.items()))
 
 
+class ScanCache:
+    """Memoizes find_disc_subfolders for one scan pass.
+
+    Entries are keyed by the folder's mtime, so a folder whose entries
+    change during the pass is re-read.
+    """
+
+    def __init__(self):
+        self._disc_subs: dict[tuple[str, int], dict[int, str]] = {}
+
+    def disc_subs(self, folder_path: str) -> dict[int, str]:
+        try:
+            mtime = os.stat(folder_path).st_mtime_ns
+        except OSError:
+            return {}
+        key = (folder_path, mtime)
+        subs = self._disc_subs.get(key)
+        if subs is None:
+            subs = self._disc_subs[key] = find_disc_subfolders(folder_path)
+        return subs
+
+
 def scan_multi_disc_album(folder_path: str, disc_folders: dict[int, str]) -> Optional[AlbumInfo]:
     """Scan a multi-disc album spread across disc subfolders.
 
@@ -363,14 +404,11 @@ def scan_multi_disc_album(folder_path: str, disc_folders: dict[int, str]) -> Opt
     all_tracks: List[TrackInfo] = []
 
     for disc_num, disc_path in sorted(disc_folders.items()):
-        for filename in sorted(os.listdir(disc_path)):
-            ext = os.path.splitext(filename)[1].lower()
-            if ext not in AUDIO_EXTENSIONS:
-                continue
-            filepath = os.path.join(disc_path, filename)
-            if not os.path.isfile(filepath):
-                continue
-            track = read_track(filepath)
+        with os.scandir(disc_path) as it:
+            entries = [e for e in it if is_audio_filename(e.name) and e.is_file()]
+        entries.sort(key=lambda e: e.name)
+        for entry in entries:
+            track = read_track(entry.path)
             if track:
                 if not track.disc_number:
                     track.disc_number = disc_num
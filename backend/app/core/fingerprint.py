@@ -1,4 +1,7 @@
+import heapq
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import List, Optional
 
@@ -36,13 +39,17 @@ _last_acoustid_request: float = 0.0
 _ACOUSTID_MIN_INTERVAL: float = 0.35  # AcoustID allows 3 req/s
 
 
+_acoustid_lock = threading.Lock()  # lookups may run from several threads
+
+
 def _acoustid_rate_limit():
     global _last_acoustid_request
-    now = time.time()
-    elapsed = now - _last_acoustid_request
-    if elapsed < _ACOUSTID_MIN_INTERVAL:
-        time.sleep(_ACOUSTID_MIN_INTERVAL - elapsed)
-    _last_acoustid_request = time.time()
+    with _acoustid_lock:
+        now = time.time()
+        elapsed = now - _last_acoustid_request
+        if elapsed < _ACOUSTID_MIN_INTERVAL:
+            time.sleep(_ACOUSTID_MIN_INTERVAL - elapsed)
+        _last_acoustid_request = time.time()
 
 
 def fingerprint_file(path: str) -> Optional[TrackFingerprint]:
@@ -131,6 +138,7 @@ def fingerprint_album(
     api_key: str,
     tracks: list,
     max_tracks: int = 5,
+    workers: int = 4,
 ) -> List[TrackFingerprint]:
     """Fingerprint a selection of tracks from an album and look them up on AcoustID.
 
@@ -138,6 +146,7 @@ def fingerprint_album(
         api_key: AcoustID API key
         tracks: list of TrackInfo objects (from audio_reader)
         max_tracks: maximum number of tracks to fingerprint
+        workers: tracks fingerprinted / looked up at the same time
 
     Returns list of TrackFingerprint with populated acoustid_results.
     """
@@ -146,20 +155,19 @@ def fingerprint_album(
         log.warning("No eligible tracks for fingerprinting (all too short?)")
         return []
 
-    fingerprints = []
-    for track in selected:
-        fp = fingerprint_file(track.path)
-        if fp:
-            fingerprints.append(fp)
+    # fpcalc runs as a subprocess and lookups wait on the network, so both
+    # overlap across threads; lookups still respect the AcoustID rate limit
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(selected)))) as pool:
+        fingerprints = [fp for fp in pool.map(fingerprint_file, [t.path for t in selected]) if fp]
 
-    if not fingerprints:
-        log.warning("All fingerprint attempts failed")
-        return []
+        if not fingerprints:
+            log.warning("All fingerprint attempts failed")
+            return []
 
-    log.info(f"Fingerprinted {len(fingerprints)}/{len(selected)} tracks, looking up on AcoustID...")
+        log.info(f"Fingerprinted {len(fingerprints)}/{len(selected)} tracks, looking up on AcoustID...")
 
-    for fp in fingerprints:
-        lookup_fingerprint(api_key, fp)
+        # lookup_fingerprint fills each TrackFingerprint in place
+        list(pool.map(lambda fp: lookup_fingerprint(api_key, fp), fingerprints))
 
     return fingerprints
 
@@ -203,8 +211,7 @@ def aggregate_release_candidates(fingerprints: List[TrackFingerprint]) -> List[F
         ))
 
     # Sort: most matched tracks first, then highest avg score
-    matches.sort(key=lambda m: (m.matched_tracks, m.avg_score), reverse=True)
-    return matches[:10]
+    return heapq.nlargest(10, matches, key=lambda m: (m.matched_tracks, m.avg_score))
 
 
 def compute_fingerprint_score(fp_match: FingerprintMatch, local_track_count: int) -> float:
@@ -60,7 +60,7 @@ def _exact_match(artist: str, title: str, album: str, duration: int) -> Optional
         data = resp.json()
         return _parse_response(data)
     except Exception as e:
-        log.debug(f"LRCLIB exact match failed for {artist} - {title}: {e}")
+        log.debug("LRCLIB exact match failed for %s - %s: %s", artist, title, e)
         return None
 
 
@@ -92,7 +92,7 @@ def _fuzzy_search(artist: str, title: str) -> Optional[LyricsResult]:
 
         return None
     except Exception as e:
-        log.debug(f"LRCLIB fuzzy search failed for {artist} - {title}: {e}")
+        log.debug("LRCLIB fuzzy search failed for %s - %s: %s", artist, title, e)
         return None
 
 
@@ -1,3 +1,4 @@
+import heapq
 import re
 import unicodedata
 from dataclasses import dataclass, field
@@ -120,13 +121,8 @@ def _score_durations(local: AlbumInfo, release: MBRelease) -> tuple[float, list[
     if not local_tracks or not release.tracks:
         return 0.0, ["No duration data available"]
 
-    # Build MB lookup by (disc_number, disc_position)
-    mb_by_disc: dict[tuple[int, int], 'MBTrack'] = {}
-    for mt in release.tracks:
-        if mt.disc_position > 0:
-            mb_by_disc[(mt.disc_number, mt.disc_position)] = mt
-
-    mb_flat = sorted(release.tracks, key=lambda t: t.position)
+    # MB lookup by (disc_number, disc_position) and flat position order
+    mb_by_disc, mb_flat = release.track_index
 
     total_deviation = 0.0
     matched = 0
@@ -372,17 +368,16 @@ def find_matches(local: AlbumInfo, limit: int = 10) -> List[MatchScore]:
         if release.track_count > 0:
             diff = abs(release.track_count - local.track_count)
             if diff > local.track_count:  # more than 2x difference
-                log.debug(f"Skipping {release.release_id}: track count {release.track_count} vs {local.track_count}")
+                log.debug("Skipping %s: track count %s vs %s", release.release_id, release.track_count, local.track_count)
                 continue
         filtered.append(release)
 
     # Pre-score using search data (no detail fetch needed) to pick top candidates
-    pre_scored = [score_release(local, release) for release in filtered]
-    pre_scored.sort(key=lambda m: m.total_score, reverse=True)
-
     # Fetch full details only for the top 5 candidates (saves ~10s per album)
     top_n = 5
-    top_candidates = pre_scored[:top_n]
+    top_candidates = heapq.nlargest(
+        top_n, (score_release(local, release) for release in filtered), key=lambda m: m.total_score
+    )
     log.info(f"Fetching details for top {len(top_candidates)} of {len(filtered)} candidates")
 
     detailed_scored = []
@@ -1,5 +1,6 @@
 import time
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Optional, List
 
 import musicbrainzngs
@@ -120,6 +121,16 @@ class MBRelease:
     disc_count: int = 1
     disc_track_counts: dict[int, int] = field(default_factory=dict)
 
+    @cached_property
+    def track_index(self) -> tuple[dict[tuple[int, int], MBTrack], List[MBTrack]]:
+        """Tracks keyed by (disc_number, disc_position), and all tracks in
+        position order. Built on first use; scoring and tagging share it."""
+        by_disc = {
+            (mt.disc_number, mt.disc_position): mt
+            for mt in self.tracks if mt.disc_position > 0
+        }
+        return by_disc, sorted(self.tracks, key=lambda t: t.position)
+
 
 def _pick_best_genres(genre_map: dict[str, int]) -> List[str]:
     """Pick the best genres, preferring specific subgenres over broad parents.
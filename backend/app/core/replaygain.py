@@ -1,12 +1,17 @@
 import math
+import os
 import re
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
 
 from app.config import settings
 from app.utils.logger import log
 
+# ffmpeg analyses run at the same time
+ANALYZE_WORKERS = os.cpu_count() or 4
+
 
 @dataclass
 class TrackLoudness:
@@ -95,11 +100,13 @@ def analyze_album(filepaths: list[str]) -> Optional[AlbumReplayGain]:
     if not filepaths:
         return None
 
+    # Each analysis is its own ffmpeg process, so threads are enough to keep
+    # every core busy; only the album figures below need all the results
     tracks: dict[str, TrackLoudness] = {}
-    for fp in filepaths:
-        tl = analyze_track(fp)
-        if tl:
-            tracks[fp] = tl
+    with ThreadPoolExecutor(max_workers=min(ANALYZE_WORKERS, len(filepaths))) as pool:
+        for fp, tl in zip(filepaths, pool.map(analyze_track, filepaths)):
+            if tl:
+                tracks[fp] = tl
 
     if not tracks:
         return None
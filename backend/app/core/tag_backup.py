@@ -1,8 +1,10 @@
-import json
 import os
 import base64
 from typing import Optional
 
+import orjson
+
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from mutagen.flac import FLAC
@@ -14,6 +16,7 @@ from mutagen.flac import Picture
 
 from app.core.tagger import TagData, write_tags
 from app.models import TagBackup, TrackTagSnapshot, Track
+from app.database import bulk_insert
 from app.config import settings
 from app.utils.logger import log
 
@@ -305,27 +308,46 @@ def _dict_to_tag_data(d: dict) -> TagData:
     )
 
 
-def create_backup(db: Session, album_id: int, action: str, track_ids: list[int] | None = None) -> Optional[int]:
+def dump_tags(d: dict) -> bytes:
+    """Encode a tag dict for storage in TrackTagSnapshot.tags_blob."""
+    return orjson.dumps(d)
+
+
+def load_tags(b: bytes) -> dict:
+    """Decode a TrackTagSnapshot.tags_blob value back into a tag dict."""
+    return orjson.loads(b)
+
+
+def create_backup(
+    db: Session, album_id: int, action: str, track_ids: list[int] | None = None,
+    tracks: list[Track] | None = None,
+) -> Optional[int]:
     """Create a backup of current tags for an album's tracks.
 
-    Returns the backup_id, or None if backups are disabled.
+    Callers that already hold the album's tracks can pass them as ``tracks``
+    to skip the query. Returns the backup_id, or None if backups are disabled.
     """
     if not settings.backup_enabled:
         return None
 
-    tracks = db.query(Track).filter(Track.album_id == album_id)
-    if track_ids:
-        tracks = tracks.filter(Track.id.in_(track_ids))
-    tracks = tracks.all()
+    if tracks is None:
+        query = db.query(Track).filter(Track.album_id == album_id)
+        if track_ids:
+            query = query.filter(Track.id.in_(track_ids))
+        tracks = query.all()
+    elif track_ids:
+        tracks = [t for t in tracks if t.id in track_ids]
 
     if not tracks:
         return None
 
-    backup = TagBackup(album_id=album_id, action=action)
-    db.add(backup)
-    db.flush()  # get backup.id
+    # RETURNING hands back the new id in the same round trip as the insert
+    backup_id = db.execute(
+        insert(TagBackup).values(album_id=album_id, action=action).returning(TagBackup.id)
+    ).scalar_one()
 
-    backup_dir = os.path.join(BACKUP_DIR, str(backup.id))
+    backup_dir = os.path.join(BACKUP_DIR, str(backup_id))
+    snapshots = []
     album_cover_file = None
 
     for track in tracks:
@@ -349,20 +371,19 @@ def create_backup(db: Session, album_id: int, action: str, track_ids: list[int]
                 log.warning(f"Failed to save backup cover for album {album_id}: {e}")
                 album_cover_file = None
 
-        snapshot = TrackTagSnapshot(
-            backup_id=backup.id,
+        snapshots.append(dict(
+            backup_id=backup_id,
             track_id=track.id,
             path=track.path,
-            tags_json=json.dumps(_tag_data_to_dict(tag_data)),
+            tags_blob=dump_tags(_tag_data_to_dict(tag_data)),
             has_cover=has_cover,
             cover_path=album_cover_file if has_cover else None,
-        )
-        db.add(snapshot)
+        ))
 
-    db.flush()
+    bulk_insert(db, TrackTagSnapshot, snapshots)
     _prune_old_backups(db, album_id)
-    log.info(f"Backup {backup.id} created for album {album_id} (action={action}, tracks={len(tracks)})")
-    return backup.id
+    log.info("Backup %s created for album %s (action=%s, tracks=%d)", backup_id, album_id, action, len(tracks))
+    return backup_id
 
 
 def restore_backup(db: Session, backup_id: int) -> tuple[int, int]:
@@ -380,7 +401,7 @@ def restore_backup(db: Session, backup_id: int) -> tuple[int, int]:
             log.warning(f"Restore: file not found {snap.path}")
             continue
 
-        tag_data = _dict_to_tag_data(json.loads(snap.tags_json))
+        tag_data = _dict_to_tag_data(load_tags(snap.tags_blob))
 
         # Restore cover from saved file
         if snap.has_cover and snap.cover_path and os.path.isfile(snap.cover_path):
@@ -433,7 +454,7 @@ def _prune_old_backups(db: Session, album_id: int):
         db.delete(b)
 
     db.flush()
-    log.debug(f"Pruned {len(to_delete)} old backups for album {album_id}")
+    log.debug("Pruned %d old backups for album %s", len(to_delete), album_id)
 
 
 def delete_backup(db: Session, backup_id: int) -> bool:
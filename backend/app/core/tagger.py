@@ -104,7 +104,7 @@ def _write_flac(filepath: str, tags: TagData) -> bool:
         audio.add_picture(pic)
 
     audio.save()
-    log.debug(f"FLAC tags written: {filepath}")
+    log.debug("FLAC tags written: %s", filepath)
     return True
 
 
@@ -161,7 +161,7 @@ def _write_mp3(filepath: str, tags: TagData) -> bool:
         ))
 
     audio.save()
-    log.debug(f"MP3 tags written: {filepath}")
+    log.debug("MP3 tags written: %s", filepath)
     return True
 
 
@@ -211,7 +211,7 @@ def _write_mp4(filepath: str, tags: TagData) -> bool:
         audio["covr"] = [MP4Cover(tags.cover_data, imageformat=fmt)]
 
     audio.save()
-    log.debug(f"MP4 tags written: {filepath}")
+    log.debug("MP4 tags written: %s", filepath)
     return True
 
 
@@ -268,5 +268,5 @@ def _write_ogg(filepath: str, tags: TagData) -> bool:
         audio["metadata_block_picture"] = base64.b64encode(pic.write()).decode("ascii")
 
     audio.save()
-    log.debug(f"OGG tags written: {filepath}")
+    log.debug("OGG tags written: %s", filepath)
     return True
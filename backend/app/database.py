@@ -1,18 +1,53 @@
-import os
+import json
+from pathlib import Path
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session, DeclarativeBase
 
-from app.config import settings
+from app.config import settings, DEFAULT_DISC_PATTERNS
 
 
-db_path = settings.database_url.replace("sqlite:///", "")
-db_dir = os.path.dirname(db_path)
-if db_dir and not os.path.exists(db_dir):
-    os.makedirs(db_dir, exist_ok=True)
+# (key, default value, value_type, description) for settings seeded on first start
+DEFAULT_SETTINGS: tuple[tuple[str, str, str, str], ...] = (
+    ("confidence_auto_threshold", "85", "float", "Auto-tag if confidence >= this"),
+    ("confidence_review_threshold", "50", "float", "Queue for review if confidence >= this"),
+    ("artwork_min_size", "500", "int", "Minimum artwork dimension in pixels"),
+    ("artwork_max_size", "1400", "int", "Maximum artwork dimension in pixels"),
+    ("watch_stabilization_delay", "30", "int", "Seconds to wait for file copy completion"),
+    ("acoustid_api_key", "", "string", "AcoustID API key for audio fingerprinting"),
+    ("fingerprint_enabled", "false", "bool", "Enable audio fingerprint matching via AcoustID"),
+    ("fanarttv_api_key", "", "string", "fanart.tv API key"),
+    ("spotify_client_id", "", "string", "Spotify client ID"),
+    ("spotify_client_secret", "", "string", "Spotify client secret"),
+    ("preferred_countries", "US,GB,DE,IT", "list", "Preferred release countries"),
+    ("preferred_media", "Digital Media,CD", "list", "Preferred media types"),
+    ("disc_subfolder_patterns", json.dumps(list(DEFAULT_DISC_PATTERNS)), "list",
+     "Regex patterns to detect disc subfolders (one capture group each)"),
+    # Backup settings
+    ("backup_enabled", "true", "bool", "Create tag backups before writing"),
+    ("backup_max_per_album", "5", "int", "Maximum backups to keep per album"),
+    # Lyrics settings
+    ("lyrics_enabled", "true", "bool", "Enable lyrics fetching"),
+    ("lyrics_auto_fetch", "false", "bool", "Auto-fetch lyrics during tagging"),
+    ("lyrics_prefer_synced", "true", "bool", "Prefer synced (LRC) lyrics when available"),
+    # ReplayGain settings
+    ("replaygain_enabled", "true", "bool", "Enable ReplayGain calculation"),
+    ("replaygain_auto_calculate", "false", "bool", "Auto-calculate ReplayGain during tagging"),
+    ("replaygain_reference_loudness", "-18.0", "float",
+     "Reference loudness in LUFS for ReplayGain"),
+)
+
+
+db_path = Path(settings.database_url.removeprefix("sqlite:///"))
+db_path.parent.mkdir(parents=True, exist_ok=True)
 
+# Connections are pooled, so a session per album or request only checks one
+# out. Sized so the queue worker, scanner, watcher and API threads don't wait
+# on each other's connections.
 engine = create_engine(
     settings.database_url,
     connect_args={"check_same_thread": False},
+    pool_size=8,
+    max_overflow=16,
     echo=False,
 )
 
@@ -20,13 +55,24 @@ engine = create_engine(
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
-    cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA foreign_keys=ON")
     cursor.execute("PRAGMA busy_timeout=5000")
     cursor.close()
 
 
+# WAL lets readers run alongside the single writer, so read-only endpoints
+# get their own engine opened with mode=ro and never touch the write lock.
+read_engine = create_engine(
+    f"sqlite:///file:{db_path}?mode=ro&uri=true",
+    connect_args={"check_same_thread": False},
+    pool_size=8,
+    echo=False,
+)
+event.listen(read_engine, "connect", set_sqlite_pragma)
+
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 
 
 class Base(DeclarativeBase):
@@ -35,147 +81,189 @@ class Base(DeclarativeBase):
 
 def init_db():
     from app.models import Album, Track, MatchCandidate, Setting, ActivityLog, TagBackup, TrackTagSnapshot  # noqa: F401
-    Base.metadata.create_all(bind=engine)
-    _migrate_add_columns()
-    _seed_default_settings()
-    _migrate_json_list_settings()
-    _migrate_disc_patterns_to_json()
+    # journal_mode is persisted in the database file, so it is set once here
+    # outside any transaction rather than on every new pool connection.
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.exec_driver_sql("PRAGMA journal_mode=WAL")
+    # Schema creation, column migrations and settings seeding all share one
+    # transaction so a cold start costs a single commit.
+    with engine.begin() as conn:
+        Base.metadata.create_all(bind=conn)
+        _bootstrap(conn)
+
 
+def _bootstrap(conn):
+    """Bring an existing database up to date inside the caller's transaction."""
+    _migrate_add_columns(conn)
+    _migrate_datetimes_to_epoch(conn)
+    _migrate_add_indexes(conn)
+    _seed_default_settings(conn)
+    _migrate_json_list_settings(conn)
+    _migrate_disc_patterns_to_json(conn)
+    _analyze_if_needed(conn)
 
-def _migrate_add_columns():
+
+def _migrate_add_columns(conn):
     """Add columns that were introduced after initial schema creation."""
-    from sqlalchemy import text
-    with engine.connect() as conn:
-        # Check existing columns in albums table
-        result = conn.execute(text("PRAGMA table_info(albums)"))
-        album_cols = {row[1] for row in result}
-        if "musicbrainz_release_group_id" not in album_cols:
-            conn.execute(text("ALTER TABLE albums ADD COLUMN musicbrainz_release_group_id TEXT"))
-        if "replaygain_album_gain" not in album_cols:
-            conn.execute(text("ALTER TABLE albums ADD COLUMN replaygain_album_gain TEXT"))
-        if "replaygain_album_peak" not in album_cols:
-            conn.execute(text("ALTER TABLE albums ADD COLUMN replaygain_album_peak TEXT"))
-
-        # Check existing columns in tracks table
-        result = conn.execute(text("PRAGMA table_info(tracks)"))
-        track_cols = {row[1] for row in result}
-        if "has_lyrics" not in track_cols:
-            conn.execute(text("ALTER TABLE tracks ADD COLUMN has_lyrics BOOLEAN DEFAULT 0"))
-        if "lyrics_synced" not in track_cols:
-            conn.execute(text("ALTER TABLE tracks ADD COLUMN lyrics_synced BOOLEAN DEFAULT 0"))
-        if "replaygain_track_gain" not in track_cols:
-            conn.execute(text("ALTER TABLE tracks ADD COLUMN replaygain_track_gain TEXT"))
-        if "replaygain_track_peak" not in track_cols:
-            conn.execute(text("ALTER TABLE tracks ADD COLUMN replaygain_track_peak TEXT"))
-
-        conn.commit()
-
-
-def _seed_default_settings():
-    import json as _json
+    # Check existing columns in albums table
+    result = conn.exec_driver_sql("PRAGMA table_info(albums)")
+    album_cols = {row[1] for row in result}
+    if "musicbrainz_release_group_id" not in album_cols:
+        conn.exec_driver_sql("ALTER TABLE albums ADD COLUMN musicbrainz_release_group_id TEXT")
+    if "replaygain_album_gain" not in album_cols:
+        conn.exec_driver_sql("ALTER TABLE albums ADD COLUMN replaygain_album_gain TEXT")
+    if "replaygain_album_peak" not in album_cols:
+        conn.exec_driver_sql("ALTER TABLE albums ADD COLUMN replaygain_album_peak TEXT")
+    if "last_fs_mtime" not in album_cols:
+        conn.exec_driver_sql("ALTER TABLE albums ADD COLUMN last_fs_mtime BIGINT")
+
+    # Check existing columns in tracks table
+    result = conn.exec_driver_sql("PRAGMA table_info(tracks)")
+    track_cols = {row[1] for row in result}
+    if "has_lyrics" not in track_cols:
+        conn.exec_driver_sql("ALTER TABLE tracks ADD COLUMN has_lyrics BOOLEAN DEFAULT 0")
+    if "lyrics_synced" not in track_cols:
+        conn.exec_driver_sql("ALTER TABLE tracks ADD COLUMN lyrics_synced BOOLEAN DEFAULT 0")
+    if "replaygain_track_gain" not in track_cols:
+        conn.exec_driver_sql("ALTER TABLE tracks ADD COLUMN replaygain_track_gain TEXT")
+    if "replaygain_track_peak" not in track_cols:
+        conn.exec_driver_sql("ALTER TABLE tracks ADD COLUMN replaygain_track_peak TEXT")
+
+    # Snapshot tags moved from a JSON TEXT column to an orjson BLOB. JSON text
+    # is valid orjson input, so existing rows convert with a plain byte cast.
+    result = conn.exec_driver_sql("PRAGMA table_info(track_tag_snapshots)")
+    snapshot_cols = {row[1] for row in result}
+    if "tags_json" in snapshot_cols:
+        if "tags_blob" not in snapshot_cols:
+            conn.exec_driver_sql("ALTER TABLE track_tag_snapshots ADD COLUMN tags_blob BLOB")
+        conn.exec_driver_sql("UPDATE track_tag_snapshots SET tags_blob = CAST(tags_json AS BLOB) WHERE tags_blob IS NULL")
+        conn.exec_driver_sql("ALTER TABLE track_tag_snapshots DROP COLUMN tags_json")
+
+
+def _migrate_datetimes_to_epoch(conn):
+    """Convert ISO-8601 TEXT timestamps to integer epoch milliseconds."""
+    from app.models import EpochMillis
+    for table in Base.metadata.sorted_tables:
+        for column in table.columns:
+            if not isinstance(column.type, EpochMillis):
+                continue
+            # Conversion is all-or-nothing inside the bootstrap transaction,
+            # so the first non-null row tells whether it has already run.
+            kind = conn.exec_driver_sql(
+                f"SELECT typeof({column.name}) FROM {table.name} "
+                f"WHERE {column.name} IS NOT NULL LIMIT 1"
+            ).scalar()
+            if kind != "text":
+                continue
+            conn.exec_driver_sql(
+                f"UPDATE {table.name} SET {column.name} = "
+                f"CAST(round((julianday({column.name}) - 2440587.5) * 86400000) AS INTEGER) "
+                f"WHERE typeof({column.name}) = 'text'"
+            )
+
+
+_DROPPED_INDEXES = (
+    "idx_albums_status",  # prefix of idx_albums_status_updated
+)
+
+
+def _migrate_add_indexes(conn):
+    """Create indexes added to the models after their table already existed."""
+    for name in _DROPPED_INDEXES:
+        conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+def _seed_default_settings(conn):
+    from sqlalchemy import insert, select
     from app.models import Setting
-    db = SessionLocal()
-    try:
-        defaults = [
-            Setting(key="confidence_auto_threshold", value="85", value_type="float",
-                    description="Auto-tag if confidence >= this"),
-            Setting(key="confidence_review_threshold", value="50", value_type="float",
-                    description="Queue for review if confidence >= this"),
-            Setting(key="artwork_min_size", value="500", value_type="int",
-                    description="Minimum artwork dimension in pixels"),
-            Setting(key="artwork_max_size", value="1400", value_type="int",
-                    description="Maximum artwork dimension in pixels"),
-            Setting(key="watch_stabilization_delay", value="30", value_type="int",
-                    description="Seconds to wait for file copy completion"),
-            Setting(key="acoustid_api_key", value="", value_type="string",
-                    description="AcoustID API key for audio fingerprinting"),
-            Setting(key="fingerprint_enabled", value="false", value_type="bool",
-                    description="Enable audio fingerprint matching via AcoustID"),
-            Setting(key="fanarttv_api_key", value="", value_type="string",
-                    description="fanart.tv API key"),
-            Setting(key="spotify_client_id", value="", value_type="string",
-                    description="Spotify client ID"),
-            Setting(key="spotify_client_secret", value="", value_type="string",
-                    description="Spotify client secret"),
-            Setting(key="preferred_countries", value="US,GB,DE,IT",
-                    value_type="list", description="Preferred release countries"),
-            Setting(key="preferred_media", value="Digital Media,CD",
-                    value_type="list", description="Preferred media types"),
-            Setting(key="disc_subfolder_patterns",
-                    value=_json.dumps([
-                        r"^(?:cd|disc|disk)\s*(\d+)$",
-                        r"^(?:(?:7|10|12)\s*(?:inch\s*)?)?vinyl\s*(\d+)$",
-                        r"^side\s*([A-Da-d\d])$",
-                        r"^cassette\s*(\d+)$",
-                    ]),
-                    value_type="list",
-                    description="Regex patterns to detect disc subfolders (one capture group each)"),
-            # Backup settings
-            Setting(key="backup_enabled", value="true", value_type="bool",
-                    description="Create tag backups before writing"),
-            Setting(key="backup_max_per_album", value="5", value_type="int",
-                    description="Maximum backups to keep per album"),
-            # Lyrics settings
-            Setting(key="lyrics_enabled", value="true", value_type="bool",
-                    description="Enable lyrics fetching"),
-            Setting(key="lyrics_auto_fetch", value="false", value_type="bool",
-                    description="Auto-fetch lyrics during tagging"),
-            Setting(key="lyrics_prefer_synced", value="true", value_type="bool",
-                    description="Prefer synced (LRC) lyrics when available"),
-            # ReplayGain settings
-            Setting(key="replaygain_enabled", value="true", value_type="bool",
-                    description="Enable ReplayGain calculation"),
-            Setting(key="replaygain_auto_calculate", value="false", value_type="bool",
-                    description="Auto-calculate ReplayGain during tagging"),
-            Setting(key="replaygain_reference_loudness", value="-18.0", value_type="float",
-                    description="Reference loudness in LUFS for ReplayGain"),
-        ]
-        for d in defaults:
-            existing = db.query(Setting).filter(Setting.key == d.key).first()
-            if not existing:
-                db.add(d)
-        db.commit()
-    finally:
-        db.close()
+    # Existing keys are left untouched; only missing defaults are inserted.
+    existing = set(conn.execute(select(Setting.key)).scalars())
+    missing = [
+        dict(key=key, value=value, value_type=value_type, description=description)
+        for key, value, value_type, description in DEFAULT_SETTINGS
+        if key not in existing
+    ]
+    if missing:
+        conn.execute(insert(Setting), missing)
 
 
-def _migrate_json_list_settings():
+def _migrate_json_list_settings(conn):
     """Convert list settings from JSON array format to comma-separated."""
-    import json as _json
+    from sqlalchemy import select, update
     from app.models import Setting
-    db = SessionLocal()
-    try:
-        for key in ("preferred_countries", "preferred_media", "artwork_sources"):
-            s = db.query(Setting).filter(Setting.key == key).first()
-            if s and s.value and s.value.startswith("["):
-                try:
-                    parsed = _json.loads(s.value)
-                    if isinstance(parsed, list):
-                        s.value = ",".join(str(v) for v in parsed)
-                except _json.JSONDecodeError:
-                    pass
-        db.commit()
-    finally:
-        db.close()
+    rows = conn.execute(
+        select(Setting.key, Setting.value).where(
+            Setting.key.in_(("preferred_countries", "preferred_media", "artwork_sources")),
+            Setting.value.like("[%"),
+        )
+    ).all()
+    for key, value in rows:
+        try:
+            parsed = json.loads(value)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(parsed, list):
+            conn.execute(
+                update(Setting).where(Setting.key == key)
+                .values(value=",".join(str(v) for v in parsed))
+            )
 
 
-def _migrate_disc_patterns_to_json():
+def _migrate_disc_patterns_to_json(conn):
     """Convert disc_subfolder_patterns from comma-separated to JSON array."""
-    import json as _json
+    from sqlalchemy import select, update
     from app.models import Setting
+    value = conn.execute(
+        select(Setting.value).where(
+            Setting.key == "disc_subfolder_patterns",
+            Setting.value.not_like("[%"),
+            Setting.value != "",
+        )
+    ).scalar()
+    if value:
+        patterns = [p.strip() for p in value.split(",") if p.strip()]
+        conn.execute(
+            update(Setting).where(Setting.key == "disc_subfolder_patterns")
+            .values(value=json.dumps(patterns))
+        )
+
+
+def bulk_insert(session: Session, model, rows: list[dict], chunk: int = 450) -> None:
+    """Insert plain dict rows for ``model`` in executemany batches of ``chunk``."""
+    from sqlalchemy import insert
+    stmt = insert(model)
+    for start in range(0, len(rows), chunk):
+        session.execute(stmt, rows[start:start + chunk])
+
+
+def _analyze_if_needed(conn):
+    """Gather planner statistics once; PRAGMA optimize keeps them fresh on shutdown."""
+    has_stats = conn.exec_driver_sql(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+    ).first()
+    if not has_stats:
+        conn.exec_driver_sql("ANALYZE")
+
+
+def optimize_db():
+    """Let SQLite re-analyze tables whose statistics have drifted."""
+    with engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA optimize")
+
+
+def get_db():
     db = SessionLocal()
     try:
-        s = db.query(Setting).filter(Setting.key == "disc_subfolder_patterns").first()
-        if s and s.value and not s.value.startswith("["):
-            patterns = [p.strip() for p in s.value.split(",") if p.strip()]
-            s.value = _json.dumps(patterns)
-            db.commit()
+        yield db
     finally:
         db.close()
 
 
-def get_db():
-    db = SessionLocal()
+def get_read_db():
+    db = ReadSessionLocal()
     try:
         yield db
     finally:
@@ -1,24 +1,29 @@
-import os
 import asyncio
+import hashlib
 from contextlib import asynccontextmanager
+from pathlib import Path
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy import select
 
-from app.database import init_db, SessionLocal
+from app.database import init_db, optimize_db, SessionLocal
 from app.models import Album
 from app.config import settings as app_settings
 from app.api import albums, settings, stats, websocket
-from app.services.queue_manager import queue_manager
-from app.services.file_watcher import FileWatcher
-from app.services.notification_service import notifications
 from app.utils.logger import log
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Services pull in mutagen, musicbrainzngs and friends; load them only
+    # when the app actually starts rather than at import time.
+    from app.services.queue_manager import queue_manager
+    from app.services.file_watcher import FileWatcher
+    from app.services.notification_service import notifications
+
     log.info("Starting MusicTaggerz...")
     init_db()
     app_settings.load_from_db()
@@ -33,11 +38,10 @@ async def lifespan(app: FastAPI):
     # Recovery: re-queue albums stuck in "matching" status from a previous run
     db = SessionLocal()
     try:
-        stuck = db.query(Album).filter(Album.status == "matching").all()
-        if stuck:
-            for album in stuck:
-                queue_manager.enqueue_album(album.id)
-            log.info(f"Recovery: re-queued {len(stuck)} albums stuck in 'matching' status")
+        stuck_ids = db.execute(select(Album.id).where(Album.status == "matching")).scalars().all()
+        if stuck_ids:
+            queue_manager.enqueue_album_many(stuck_ids)
+            log.info(f"Recovery: re-queued {len(stuck_ids)} albums stuck in 'matching' status")
     finally:
         db.close()
 
@@ -48,6 +52,8 @@ async def lifespan(app: FastAPI):
 
     watcher.stop()
     queue_manager.stop()
+    notifications.close()
+    optimize_db()
     log.info("Shutting down MusicTaggerz.")
 
 
@@ -77,14 +83,30 @@ def health():
     return {"status": "ok", "version": "1.0.0"}
 
 
-static_dir = os.path.join(os.path.dirname(__file__), "..", "static")
-if os.path.isdir(static_dir):
-    app.mount("/assets", StaticFiles(directory=os.path.join(static_dir, "assets")), name="assets")
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+ASSETS_DIR = STATIC_DIR / "assets"
+INDEX_HTML = STATIC_DIR / "index.html"
+
+if STATIC_DIR.is_dir():
+    app.mount("/assets", StaticFiles(directory=ASSETS_DIR), name="assets")
+
+    # The frontend bundle is baked into the image, so index.html is read and
+    # hashed once. Set CACHE_INDEX_HTML=false while editing the frontend.
+    _index_html: bytes | None = None
+    _index_etag = ""
+    if app_settings.cache_index_html and INDEX_HTML.is_file():
+        _index_html = INDEX_HTML.read_bytes()
+        _index_etag = f'"{hashlib.sha256(_index_html).hexdigest()[:16]}"'
 
     @app.get("/{full_path:path}")
-    async def serve_spa(full_path: str):
+    async def serve_spa(full_path: str, request: Request):
         """Serve static files if they exist, otherwise index.html for SPA routing."""
-        file_path = os.path.join(static_dir, full_path)
-        if full_path and os.path.isfile(file_path):
+        file_path = STATIC_DIR / full_path
+        if full_path and file_path.is_file():
             return FileResponse(file_path)
-        return FileResponse(os.path.join(static_dir, "index.html"))
+        if _index_html is None:
+            return FileResponse(INDEX_HTML)
+        headers = {"ETag": _index_etag, "Cache-Control": "no-cache"}
+        if request.headers.get("if-none-match") == _index_etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=_index_html, media_type="text/html", headers=headers)
@@ -1,7 +1,8 @@
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from sqlalchemy import (
-    Column, Integer, String, Float, Boolean, Text, ForeignKey, DateTime, Index
+    Column, Integer, BigInteger, String, Float, Boolean, Text, ForeignKey, Index, LargeBinary
 )
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -11,10 +12,34 @@ def utcnow():
     return datetime.now(timezone.utc)
 
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+class EpochMillis(TypeDecorator):
+    """UTC datetime stored as integer milliseconds since the Unix epoch.
+
+    Reads return naive UTC datetimes, same as the previous DateTime columns.
+    """
+    impl = BigInteger
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return (value - _EPOCH) // timedelta(milliseconds=1)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return _EPOCH + timedelta(milliseconds=value)
+
+
 class Album(Base):
     __tablename__ = "albums"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, primary_key=True)
     path = Column(String, nullable=False, unique=True)
     artist = Column(String)
     album = Column(String)
@@ -30,22 +55,26 @@ class Album(Base):
     retry_count = Column(Integer, default=0)
     replaygain_album_gain = Column(String)
     replaygain_album_peak = Column(String)
-    created_at = Column(DateTime, default=utcnow)
-    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
+    last_fs_mtime = Column(BigInteger)  # newest folder st_mtime_ns seen by the last scan
+    created_at = Column(EpochMillis, default=utcnow)
+    updated_at = Column(EpochMillis, default=utcnow, onupdate=utcnow)
 
     tracks = relationship("Track", back_populates="album", cascade="all, delete-orphan")
     match_candidates = relationship("MatchCandidate", back_populates="album_obj", cascade="all, delete-orphan")
 
     __table_args__ = (
-        Index("idx_albums_status", "status"),
         Index("idx_albums_updated", "updated_at"),
+        # Serves the filtered album list (WHERE status = ? ORDER BY updated_at DESC)
+        # without a sort step, and as a covering index for status counts and
+        # lookups; the rowid (id) is implicitly part of every index.
+        Index("idx_albums_status_updated", "status", updated_at.desc()),
     )
 
 
 class Track(Base):
     __tablename__ = "tracks"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, primary_key=True)
     album_id = Column(Integer, ForeignKey("albums.id", ondelete="CASCADE"), nullable=False)
     path = Column(String, nullable=False, unique=True)
     track_number = Column(Integer)
@@ -60,8 +89,8 @@ class Track(Base):
     lyrics_synced = Column(Boolean, default=False)
     replaygain_track_gain = Column(String)
     replaygain_track_peak = Column(String)
-    created_at = Column(DateTime, default=utcnow)
-    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
+    created_at = Column(EpochMillis, default=utcnow)
+    updated_at = Column(EpochMillis, default=utcnow, onupdate=utcnow)
 
     album = relationship("Album", back_populates="tracks")
 
@@ -73,7 +102,7 @@ class Track(Base):
 class MatchCandidate(Base):
     __tablename__ = "match_candidates"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, primary_key=True)
     album_id = Column(Integer, ForeignKey("albums.id", ondelete="CASCADE"), nullable=False)
     musicbrainz_release_id = Column(String, nullable=False)
     confidence = Column(Float, nullable=False)
@@ -87,7 +116,7 @@ class MatchCandidate(Base):
     label = Column(String)
     barcode = Column(String)
     is_selected = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=utcnow)
+    created_at = Column(EpochMillis, default=utcnow)
 
     album_obj = relationship("Album", back_populates="match_candidates")
 
@@ -103,17 +132,17 @@ class Setting(Base):
     value = Column(Text)
     value_type = Column(String)
     description = Column(Text)
-    updated_at = Column(DateTime, default=utcnow, onupdate=utcnow)
+    updated_at = Column(EpochMillis, default=utcnow, onupdate=utcnow)
 
 
 class ActivityLog(Base):
     __tablename__ = "activity_log"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, primary_key=True)
     album_id = Column(Integer, ForeignKey("albums.id", ondelete="SET NULL"))
     action = Column(String, nullable=False)
     details = Column(Text)
-    timestamp = Column(DateTime, default=utcnow)
+    timestamp = Column(EpochMillis, default=utcnow)
 
     __table_args__ = (
         Index("idx_activity_timestamp", "timestamp"),
@@ -123,10 +152,10 @@ class ActivityLog(Base):
 class TagBackup(Base):
     __tablename__ = "tag_backups"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, primary_key=True)
     album_id = Column(Integer, ForeignKey("albums.id", ondelete="CASCADE"), nullable=False)
     action = Column(String, nullable=False)  # musicbrainz_tag, manual_edit, artwork, lyrics, replaygain, pre_restore
-    created_at = Column(DateTime, default=utcnow)
+    created_at = Column(EpochMillis, default=utcnow)
 
     snapshots = relationship("TrackTagSnapshot", back_populates="backup", cascade="all, delete-orphan")
 
@@ -138,11 +167,11 @@ class TagBackup(Base):
 class TrackTagSnapshot(Base):
     __tablename__ = "track_tag_snapshots"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
+    id = Column(Integer, primary_key=True)
     backup_id = Column(Integer, ForeignKey("tag_backups.id", ondelete="CASCADE"), nullable=False)
     track_id = Column(Integer, ForeignKey("tracks.id", ondelete="CASCADE"), nullable=False)
     path = Column(String, nullable=False)
-    tags_json = Column(Text, nullable=False)  # JSON serialized tag data
+    tags_blob = Column(LargeBinary, nullable=False)  # orjson-encoded tag data
     has_cover = Column(Boolean, default=False)
     cover_path = Column(String)  # path to saved cover file on disk
 
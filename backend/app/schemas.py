@@ -1,3 +1,5 @@
+from operator import attrgetter
+
 from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
@@ -79,6 +81,17 @@ class AlbumListResponse(BaseModel):
     offset: int
 
 
+_ALBUM_SUMMARY_FIELDS = tuple(AlbumSummary.model_fields)
+_get_album_summary_fields = attrgetter(*_ALBUM_SUMMARY_FIELDS)
+
+
+def album_to_summary(album) -> AlbumSummary:
+    """Build an AlbumSummary from a trusted Album row without validation."""
+    return AlbumSummary.model_construct(
+        **dict(zip(_ALBUM_SUMMARY_FIELDS, _get_album_summary_fields(album)))
+    )
+
+
 class TagRequest(BaseModel):
     release_id: Optional[str] = None
 
@@ -1,25 +1,38 @@
 import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import List
 
+from sqlalchemy import bindparam, delete, select, update
 from sqlalchemy.orm import Session
 
 from app.core.audio_reader import (
-    scan_album_folder, scan_multi_disc_album, find_disc_subfolders,
-    has_audio_files, is_disc_subfolder, AUDIO_EXTENSIONS, AlbumInfo,
+    scan_album_folder, scan_multi_disc_album, find_disc_subfolders, ScanCache,
+    has_audio_files, is_disc_subfolder, AlbumInfo,
 )
-from app.models import Album, Track, ActivityLog
-from app.database import SessionLocal
+from app.models import Album, Track, ActivityLog, utcnow
+from app.database import SessionLocal, bulk_insert
 from app.config import settings
 from app.services.notification_service import notifications
 from app.utils.logger import log
 
+# Sentinel for "caller did not look this up"; None is a meaningful value
+_UNSET = object()
 
-def scan_directory(path: str = None, force: bool = False) -> List[int]:
+# Tag reading is I/O bound; capped so rotating disks don't thrash
+SCAN_WORKERS = min(8, os.cpu_count() or 4)
+# Albums read ahead of the DB writer; bounds memory held by pending results
+SCAN_READ_AHEAD = 32
+
+
+def scan_directory(path: str = None, force: bool = False, commit_every: int = 500) -> List[int]:
     """Scan a directory for albums.
 
     Args:
         path: Directory to scan (defaults to MUSIC_DIR)
         force: If True, re-scan albums already in the database (reset to pending)
+        commit_every: Number of album folders to process per transaction
     """
     scan_path = path or settings.music_dir
     log.info(f"Scanning directory: {scan_path} (force={force})")
@@ -28,61 +41,86 @@ def scan_directory(path: str = None, force: bool = False) -> List[int]:
     new_album_ids = []
     db = SessionLocal()
     try:
-        for entry in sorted(os.listdir(scan_path)):
-            folder_path = os.path.join(scan_path, entry)
-            if not os.path.isdir(folder_path):
-                continue
-            if entry.startswith("."):
-                continue
-
-            if has_audio_files(folder_path):
-                # Level 1: direct audio files → single album
-                existing = db.query(Album).filter(Album.path == folder_path).first()
-                is_new = existing is None or force
-                album_id = _scan_album_folder(db, folder_path, force=force)
-                if album_id:
-                    album_ids.append(album_id)
-                    if is_new:
-                        new_album_ids.append(album_id)
-            else:
-                # Check if this folder has disc subfolders (e.g. Album/CD1/)
-                disc_subs = find_disc_subfolders(folder_path)
-                if disc_subs:
-                    existing = db.query(Album).filter(Album.path == folder_path).first()
-                    is_new = existing is None or force
-                    album_id = _scan_multi_disc_folder(db, folder_path, disc_subs, force=force)
+        # One query for every known album instead of a lookup per folder
+        existing_ids: dict[str, int] = {}
+        known_mtimes: dict[str, int | None] = {}
+        for album_path, album_id, fs_mtime in db.execute(
+            select(Album.path, Album.id, Album.last_fs_mtime)
+        ):
+            existing_ids[album_path] = album_id
+            known_mtimes[album_path] = fs_mtime
+
+        # Classify folders first (cheap), then read tags for all of them on a
+        # thread pool. DB writes stay on this thread with its own Session.
+        cache = ScanCache()
+        worklist = _collect_album_folders(scan_path, cache)
+        uncommitted = 0
+        # Track and activity rows are written with one executemany per commit
+        writes = _ScanWrites()
+
+        def read_info(item):
+            folder_path, disc_subs = item
+            # Stat before reading so a change made mid-read is seen next scan
+            fs_mtime = _folder_mtime(folder_path)
+            if folder_path in existing_ids and not force:
+                if fs_mtime is not None and fs_mtime == known_mtimes[folder_path]:
+                    # No track added or removed since the last scan
+                    return _UNSET, fs_mtime
+                # Incremental update re-detects disc subfolders itself
+                return _read_album_info(folder_path, disc_subs or None, cache), fs_mtime
+            return _read_album_info(folder_path, disc_subs, cache), fs_mtime
+
+        with ThreadPoolExecutor(max_workers=SCAN_WORKERS) as pool:
+            results = zip(worklist, _read_ahead(pool, read_info, worklist, SCAN_READ_AHEAD))
+            while batch := list(islice(results, SCAN_READ_AHEAD)):
+                # Existing albums that need an update are loaded in one query
+                # per batch and handed to the helpers
+                load_ids = [
+                    existing_ids[folder_path]
+                    for (folder_path, _), (album_info, _) in batch
+                    if folder_path in existing_ids and album_info is not _UNSET
+                ]
+                albums = {
+                    a.id: a for a in db.scalars(select(Album).where(Album.id.in_(load_ids)))
+                } if load_ids else {}
+
+                for (folder_path, disc_subs), (album_info, fs_mtime) in batch:
+                    existing_id = existing_ids.get(folder_path)
+                    is_new = existing_id is None or force
+                    if album_info is _UNSET:
+                        album_id = existing_id
+                    else:
+                        existing = albums.get(existing_id)
+                        if disc_subs:
+                            album_id = _scan_multi_disc_folder(
+                                db, folder_path, disc_subs, force=force,
+                                existing=existing, album_info=album_info, writes=writes,
+                                fs_mtime=fs_mtime,
+                            )
+                        else:
+                            album_id = _scan_album_folder(
+                                db, folder_path, force=force,
+                                existing=existing, album_info=album_info, writes=writes,
+                                fs_mtime=fs_mtime,
+                            )
+                        # New albums are created with their mtime already set
+                        if album_id and fs_mtime is not None and not is_new:
+                            writes.fs_mtimes.append(dict(b_id=album_id, b_mtime=fs_mtime))
                     if album_id:
                         album_ids.append(album_id)
                         if is_new:
                             new_album_ids.append(album_id)
-                else:
-                    # Level 2: Artist/Album structure
-                    for sub_entry in sorted(os.listdir(folder_path)):
-                        sub_path = os.path.join(folder_path, sub_entry)
-                        if not os.path.isdir(sub_path):
-                            continue
-                        if sub_entry.startswith("."):
-                            continue
-
-                        if has_audio_files(sub_path):
-                            existing = db.query(Album).filter(Album.path == sub_path).first()
-                            is_new = existing is None or force
-                            album_id = _scan_album_folder(db, sub_path, force=force)
-                            if album_id:
-                                album_ids.append(album_id)
-                                if is_new:
-                                    new_album_ids.append(album_id)
-                        else:
-                            # Level 3: Artist/Album/CD1/ structure
-                            disc_subs_2 = find_disc_subfolders(sub_path)
-                            if disc_subs_2:
-                                existing = db.query(Album).filter(Album.path == sub_path).first()
-                                is_new = existing is None or force
-                                album_id = _scan_multi_disc_folder(db, sub_path, disc_subs_2, force=force)
-                                if album_id:
-                                    album_ids.append(album_id)
-                                    if is_new:
-                                        new_album_ids.append(album_id)
+
+                # Helpers only flush; commit in chunks so a full-library scan
+                # costs one WAL sync per chunk instead of one per album.
+                # Committing between batches keeps loaded albums unexpired.
+                uncommitted += len(batch)
+                if uncommitted >= commit_every:
+                    writes.flush(db)
+                    db.commit()
+                    uncommitted = 0
+        writes.flush(db)
+        db.commit()
 
         log.info(f"Scan complete. Found {len(album_ids)} albums ({len(new_album_ids)} new).")
         notifications.send_scan_update(len(album_ids), "Scan complete")
@@ -93,27 +131,169 @@ def scan_directory(path: str = None, force: bool = False) -> List[int]:
         # auto_tag_on_scan setting (auto mode) vs needs_review (manual mode).
         if new_album_ids:
             from app.services.queue_manager import queue_manager
-            queued = 0
-            for aid in new_album_ids:
-                album = db.query(Album).filter(Album.id == aid).first()
-                if album and album.status == "pending":
-                    album.status = "matching"
-                    queue_manager.enqueue_album(aid)  # user_initiated=False (default)
-                    queued += 1
+            pending: set[int] = set()
+            # Chunked to stay under SQLite's bound parameter limit
+            for i in range(0, len(new_album_ids), 500):
+                chunk = new_album_ids[i:i + 500]
+                pending.update(db.scalars(
+                    update(Album)
+                    .where(Album.id.in_(chunk), Album.status == "pending")
+                    .values(status="matching")
+                    .returning(Album.id)
+                ))
             db.commit()
-            log.info(f"Auto-queued {queued} new albums for matching")
-            notifications.send_notification("info", f"Matching {queued} new albums")
+            queued_ids = [aid for aid in new_album_ids if aid in pending]
+            queue_manager.enqueue_album_many(queued_ids)  # user_initiated=False (default)
+            log.info(f"Auto-queued {len(queued_ids)} new albums for matching")
+            notifications.send_notification("info", f"Matching {len(queued_ids)} new albums")
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
 
     return album_ids
 
 
-def _scan_album_folder(db: Session, folder_path: str, force: bool = False) -> int | None:
-    existing = db.query(Album).filter(Album.path == folder_path).first()
+def _read_ahead(pool: ThreadPoolExecutor, fn, items, window: int):
+    """Like pool.map, but with at most `window` calls submitted ahead.
+
+    Workers keep reading while the caller writes the previous results, and
+    on error only the in-flight calls are waited for instead of the rest of
+    the library. Results come back in input order; worker exceptions are
+    re-raised here.
+    """
+    pending = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(pool.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def _collect_album_folders(scan_path: str, cache: ScanCache) -> list[tuple[str, dict[int, str]]]:
+    """Find album folders under scan_path without reading any tags.
+
+    Returns (path, disc_subs) pairs in scan order; disc_subs is empty for
+    single-folder albums.
+    """
+    found: list[tuple[str, dict[int, str]]] = []
+    for entry in _list_subdirs(scan_path):
+        folder_path = entry.path
+
+        if has_audio_files(folder_path):
+            # Level 1: direct audio files → single album
+            found.append((folder_path, {}))
+            continue
+        # Check if this folder has disc subfolders (e.g. Album/CD1/)
+        disc_subs = cache.disc_subs(folder_path)
+        if disc_subs:
+            found.append((folder_path, disc_subs))
+            continue
+        # Level 2: Artist/Album structure
+        for sub_entry in _list_subdirs(folder_path):
+            sub_path = sub_entry.path
+            if has_audio_files(sub_path):
+                found.append((sub_path, {}))
+                continue
+            # Level 3: Artist/Album/CD1/ structure
+            disc_subs_2 = cache.disc_subs(sub_path)
+            if disc_subs_2:
+                found.append((sub_path, disc_subs_2))
+    return found
+
+
+def _folder_mtime(folder_path: str) -> int | None:
+    """Newest st_mtime_ns of an album folder and its disc-named subfolders.
+
+    Adding or removing a track bumps the mtime of the directory holding it.
+    """
+    try:
+        mtime = os.stat(folder_path).st_mtime_ns
+        with os.scandir(folder_path) as it:
+            for e in it:
+                if is_disc_subfolder(e.name) and e.is_dir():
+                    mtime = max(mtime, e.stat().st_mtime_ns)
+    except OSError:
+        return None
+    return mtime
+
+
+def _read_album_info(
+    folder_path: str, disc_subs: dict[int, str] | None = None, cache: ScanCache | None = None,
+) -> AlbumInfo | None:
+    """Read tags for an album folder.
+
+    disc_subs: disc subfolders for a multi-disc album, {} for a single
+    folder, or None to detect them.
+    """
+    if disc_subs is None:
+        disc_subs = cache.disc_subs(folder_path) if cache else find_disc_subfolders(folder_path)
+    if disc_subs:
+        return scan_multi_disc_album(folder_path, disc_subs)
+    return scan_album_folder(folder_path)
+
+
+def _list_subdirs(path: str) -> list[os.DirEntry]:
+    """Non-hidden subdirectories of path, in directory order.
+
+    Uses scandir so the directory check comes from the readdir result
+    instead of a stat() per entry. Sorted by name only with
+    debug_sorted_scan, for reproducible scan order and album ids.
+    """
+    with os.scandir(path) as it:
+        entries = [e for e in it if not e.name.startswith(".") and e.is_dir()]
+    if settings.debug_sorted_scan:
+        entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def _get_existing(db: Session, path: str, existing) -> Album | None:
+    """Resolve the Album for path, unless the caller already looked it up."""
+    if existing is _UNSET:
+        return db.query(Album).filter(Album.path == path).first()
+    return existing
+
+
+class _ScanWrites:
+    """Track and activity rows, and folder mtimes of rescanned albums,
+    queued by the scan.
+
+    Written with one executemany per table when the scan commits, instead
+    of a round of statements per album.
+    """
+
+    def __init__(self):
+        self.tracks: list[dict] = []
+        self.activity: list[dict] = []
+        self.fs_mtimes: list[dict] = []  # {"b_id": album id, "b_mtime": mtime}
+
+    def flush(self, db: Session):
+        bulk_insert(db, Track, self.tracks)
+        bulk_insert(db, ActivityLog, self.activity)
+        if self.fs_mtimes:
+            albums = Album.__table__
+            # Keeps updated_at as is: only the scan bookkeeping changed
+            db.execute(
+                update(albums)
+                .where(albums.c.id == bindparam("b_id"))
+                .values(last_fs_mtime=bindparam("b_mtime"), updated_at=albums.c.updated_at),
+                self.fs_mtimes,
+            )
+        self.tracks.clear()
+        self.activity.clear()
+        self.fs_mtimes.clear()
+
+
+def _scan_album_folder(
+    db: Session, folder_path: str, force: bool = False, existing=_UNSET, album_info=_UNSET,
+    cache: ScanCache | None = None, writes: _ScanWrites | None = None, fs_mtime: int | None = None,
+) -> int | None:
+    existing = _get_existing(db, folder_path, existing)
     if existing:
         if not force:
-            changed = _incremental_update(db, existing)
+            changed = _incremental_update(db, existing, album_info, cache, writes)
             if changed:
                 log.info(f"Incremental update found changes: {folder_path}")
             return existing.id
@@ -123,12 +303,15 @@ def _scan_album_folder(db: Session, folder_path: str, force: bool = False) -> in
         db.delete(existing)
         db.flush()
 
-    album_info = scan_album_folder(folder_path)
+    if album_info is _UNSET:
+        album_info = scan_album_folder(folder_path)
     if not album_info:
         return None
 
     log.info(f"New album: {album_info.artist} - {album_info.album} ({album_info.track_count} tracks)")
 
+    # Save MusicBrainz IDs from files if present (preserves data on DB recreate)
+    # but do NOT change album status - that's decided by the tagging pipeline
     album = Album(
         path=folder_path,
         artist=album_info.artist,
@@ -136,44 +319,30 @@ def _scan_album_folder(db: Session, folder_path: str, force: bool = False) -> in
         year=album_info.year,
         status="pending",
         track_count=album_info.track_count,
+        musicbrainz_release_id=_first_release_id(album_info),
+        last_fs_mtime=fs_mtime,
     )
     db.add(album)
     db.flush()
 
-    # Save MusicBrainz IDs from files if present (preserves data on DB recreate)
-    # but do NOT change album status - that's decided by the tagging pipeline
-    for track_info in album_info.tracks:
-        track = Track(
-            album_id=album.id,
-            path=track_info.path,
-            track_number=track_info.track_number,
-            disc_number=track_info.disc_number or 1,
-            title=track_info.title,
-            artist=track_info.artist,
-            duration=track_info.duration,
-            musicbrainz_recording_id=track_info.musicbrainz_recording_id,
-            status="pending",
-        )
-        db.add(track)
-        if track_info.musicbrainz_release_id and not album.musicbrainz_release_id:
-            album.musicbrainz_release_id = track_info.musicbrainz_release_id
-
-    db.add(ActivityLog(
-        album_id=album.id,
-        action="scanned",
-        details=f"{album_info.track_count} tracks",
-    ))
-
-    db.commit()
+    _add_tracks(db, writes, [_track_row(album.id, ti) for ti in album_info.tracks])
+
+    _log_activity(db, writes, album.id, "scanned", f"{album_info.track_count} tracks")
+
+    db.flush()
     return album.id
 
 
-def _scan_multi_disc_folder(db: Session, parent_path: str, disc_subs: dict[int, str], force: bool = False) -> int | None:
+def _scan_multi_disc_folder(
+    db: Session, parent_path: str, disc_subs: dict[int, str], force: bool = False,
+    existing=_UNSET, album_info=_UNSET, cache: ScanCache | None = None,
+    writes: _ScanWrites | None = None, fs_mtime: int | None = None,
+) -> int | None:
     """Scan a multi-disc album and create a single Album record."""
-    existing = db.query(Album).filter(Album.path == parent_path).first()
+    existing = _get_existing(db, parent_path, existing)
     if existing:
         if not force:
-            changed = _incremental_update(db, existing)
+            changed = _incremental_update(db, existing, album_info, cache, writes)
             if changed:
                 log.info(f"Incremental update found changes (multi-disc): {parent_path}")
             return existing.id
@@ -183,15 +352,20 @@ def _scan_multi_disc_folder(db: Session, parent_path: str, disc_subs: dict[int,
         db.flush()
 
     # Cleanup: remove any old Album records that pointed to individual disc subfolders
-    for disc_path in disc_subs.values():
-        old = db.query(Album).filter(Album.path == disc_path).first()
-        if old:
+    old_rows = db.execute(
+        select(Album.id, Album.path).where(Album.path.in_(list(disc_subs.values())))
+    ).all()
+    if old_rows:
+        for _, disc_path in old_rows:
             log.info(f"Removing old per-disc record: {disc_path}")
-            db.query(Track).filter(Track.album_id == old.id).delete()
-            db.delete(old)
+        old_ids = [album_id for album_id, _ in old_rows]
+        # Candidates and backups go with the albums via ON DELETE CASCADE
+        db.execute(delete(Track).where(Track.album_id.in_(old_ids)))
+        db.execute(delete(Album).where(Album.id.in_(old_ids)))
     db.flush()
 
-    album_info = scan_multi_disc_album(parent_path, disc_subs)
+    if album_info is _UNSET:
+        album_info = scan_multi_disc_album(parent_path, disc_subs)
     if not album_info:
         return None
 
@@ -205,54 +379,79 @@ def _scan_multi_disc_folder(db: Session, parent_path: str, disc_subs: dict[int,
         year=album_info.year,
         status="pending",
         track_count=album_info.track_count,
+        musicbrainz_release_id=_first_release_id(album_info),
+        last_fs_mtime=fs_mtime,
     )
     db.add(album)
     db.flush()
 
-    for track_info in album_info.tracks:
-        track = Track(
-            album_id=album.id,
-            path=track_info.path,
-            track_number=track_info.track_number,
-            disc_number=track_info.disc_number or 1,
-            title=track_info.title,
-            artist=track_info.artist,
-            duration=track_info.duration,
-            musicbrainz_recording_id=track_info.musicbrainz_recording_id,
-            status="pending",
-        )
-        db.add(track)
-        if track_info.musicbrainz_release_id and not album.musicbrainz_release_id:
-            album.musicbrainz_release_id = track_info.musicbrainz_release_id
-
-    db.add(ActivityLog(
-        album_id=album.id,
-        action="scanned",
-        details=f"{album_info.track_count} tracks, {album_info.disc_count} discs",
-    ))
-
-    db.commit()
+    _add_tracks(db, writes, [_track_row(album.id, ti) for ti in album_info.tracks])
+
+    _log_activity(
+        db, writes, album.id, "scanned",
+        f"{album_info.track_count} tracks, {album_info.disc_count} discs",
+    )
+
+    db.flush()
     return album.id
 
 
-def _incremental_update(db: Session, album: Album) -> bool:
+def _track_row(album_id: int, ti) -> dict:
+    """Column values for a newly discovered track."""
+    return dict(
+        album_id=album_id,
+        path=ti.path,
+        track_number=ti.track_number,
+        disc_number=ti.disc_number or 1,
+        title=ti.title,
+        artist=ti.artist,
+        duration=ti.duration,
+        musicbrainz_recording_id=ti.musicbrainz_recording_id,
+        status="pending",
+    )
+
+
+def _add_tracks(db: Session, writes: _ScanWrites | None, rows: list[dict]):
+    """Insert Track rows now, or queue them on `writes`."""
+    if writes is None:
+        bulk_insert(db, Track, rows)
+    else:
+        writes.tracks.extend(rows)
+
+
+def _log_activity(db: Session, writes: _ScanWrites | None, album_id: int, action: str, details: str):
+    """Record an ActivityLog row, or queue it on `writes`."""
+    if writes is None:
+        db.add(ActivityLog(album_id=album_id, action=action, details=details))
+    else:
+        writes.activity.append(dict(album_id=album_id, action=action, details=details, timestamp=utcnow()))
+
+
+def _first_release_id(album_info: AlbumInfo) -> str | None:
+    """First MusicBrainz release ID found in the album's file tags."""
+    return next(
+        (ti.musicbrainz_release_id for ti in album_info.tracks if ti.musicbrainz_release_id),
+        None,
+    )
+
+
+def _incremental_update(
+    db: Session, album: Album, album_info=_UNSET, cache: ScanCache | None = None,
+    writes: _ScanWrites | None = None,
+) -> bool:
     """Compare disk files vs DB tracks for an existing album.
 
     Adds new tracks, removes deleted tracks, and resets album to pending
     if any changes are found. Returns True if changes were made.
     """
-    disc_subs = find_disc_subfolders(album.path)
-    if disc_subs:
-        album_info = scan_multi_disc_album(album.path, disc_subs)
-    else:
-        album_info = scan_album_folder(album.path)
+    if album_info is _UNSET:
+        album_info = _read_album_info(album.path, cache=cache)
 
     if not album_info:
         return False
 
     disk_paths = {t.path for t in album_info.tracks}
-    db_tracks = db.query(Track).filter(Track.album_id == album.id).all()
-    db_paths = {t.path for t in db_tracks}
+    db_paths = set(db.scalars(select(Track.path).where(Track.album_id == album.id)))
 
     added = disk_paths - db_paths
     removed = db_paths - disk_paths
@@ -263,20 +462,8 @@ def _incremental_update(db: Session, album: Album) -> bool:
     # Build a lookup for quick access to scanned track info
     track_info_map = {t.path: t for t in album_info.tracks}
 
-    for path in added:
-        ti = track_info_map[path]
-        track = Track(
-            album_id=album.id,
-            path=ti.path,
-            track_number=ti.track_number,
-            disc_number=ti.disc_number or 1,
-            title=ti.title,
-            artist=ti.artist,
-            duration=ti.duration,
-            musicbrainz_recording_id=ti.musicbrainz_recording_id,
-            status="pending",
-        )
-        db.add(track)
+    if added:
+        _add_tracks(db, writes, [_track_row(album.id, track_info_map[path]) for path in added])
 
     if removed:
         db.query(Track).filter(Track.path.in_(removed)).delete(synchronize_session=False)
@@ -291,13 +478,9 @@ def _incremental_update(db: Session, album: Album) -> bool:
         changes.append(f"-{len(removed)} tracks")
     detail = ", ".join(changes)
 
-    db.add(ActivityLog(
-        album_id=album.id,
-        action="incremental_update",
-        details=detail,
-    ))
+    _log_activity(db, writes, album.id, "incremental_update", detail)
 
-    db.commit()
+    db.flush()
     log.info(f"Incremental update for '{album.artist} - {album.album}': {detail}")
     return True
 
@@ -305,20 +488,26 @@ def _incremental_update(db: Session, album: Album) -> bool:
 def scan_single_folder(folder_path: str) -> int | None:
     db = SessionLocal()
     try:
-        # If this folder is a disc subfolder, scan the parent as multi-disc
-        folder_name = os.path.basename(folder_path)
-        if is_disc_subfolder(folder_name):
-            parent_path = os.path.dirname(folder_path)
-            disc_subs = find_disc_subfolders(parent_path)
-            if disc_subs:
-                return _scan_multi_disc_folder(db, parent_path, disc_subs)
-
-        # Check if the folder itself has disc subfolders
-        disc_subs = find_disc_subfolders(folder_path)
-        if disc_subs:
-            return _scan_multi_disc_folder(db, folder_path, disc_subs)
-
-        album_id = _scan_album_folder(db, folder_path)
+        album_id = _scan_single_folder(db, folder_path)
+        db.commit()
         return album_id
     finally:
         db.close()
+
+
+def _scan_single_folder(db: Session, folder_path: str) -> int | None:
+    cache = ScanCache()
+    # If this folder is a disc subfolder, scan the parent as multi-disc
+    folder_name = os.path.basename(folder_path)
+    if is_disc_subfolder(folder_name):
+        parent_path = os.path.dirname(folder_path)
+        disc_subs = cache.disc_subs(parent_path)
+        if disc_subs:
+            return _scan_multi_disc_folder(db, parent_path, disc_subs, cache=cache)
+
+    # Check if the folder itself has disc subfolders
+    disc_subs = cache.disc_subs(folder_path)
+    if disc_subs:
+        return _scan_multi_disc_folder(db, folder_path, disc_subs, cache=cache)
+
+    return _scan_album_folder(db, folder_path, cache=cache)
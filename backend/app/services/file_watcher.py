@@ -1,9 +1,17 @@
+import heapq
 import os
 import time
 import threading
 from typing import Callable, Optional
 
-from app.core.audio_reader import AUDIO_EXTENSIONS, is_disc_subfolder, find_disc_subfolders
+from watchdog.events import (
+    EVENT_TYPE_CREATED, EVENT_TYPE_DELETED, EVENT_TYPE_MODIFIED, EVENT_TYPE_MOVED,
+    FileSystemEventHandler,
+)
+
+from app.core.audio_reader import (
+    is_audio_filename, is_disc_subfolder, has_audio_files, find_disc_subfolders, ScanCache,
+)
 from app.config import settings
 from app.utils.logger import log
 
@@ -15,28 +23,28 @@ class _PollingScanner:
     Docker containers through bind mounts.
     """
 
-    _POLL_INTERVAL = 60  # seconds between scans
-
-    def __init__(self, watch_path: str, callback: Callable[[str], None]):
+    def __init__(self, watch_path: str, callback: Callable[[str], None], interval: int = 60):
         self._watch_path = watch_path
         self._callback = callback
+        self._interval = interval  # seconds between scans
         self._known_folders: set[str] = set()
         self._folder_file_counts: dict[str, int] = {}
+        # st_mtime_ns of each known folder and its disc-named subfolders,
+        # taken when the folder was last counted
+        self._folder_mtimes: dict[str, dict[str, int]] = {}
         self._running = False
         self._thread: Optional[threading.Thread] = None
 
     def start(self):
         try:
             self._known_folders = self._load_known_folders()
-            self._folder_file_counts = {
-                folder: self._count_audio_files(folder)
-                for folder in self._known_folders
-            }
+            self._folder_file_counts = self._initial_file_counts()
             log.info(f"Polling scanner: {len(self._known_folders)} known folders in DB")
         except Exception as e:
             log.error(f"Failed to load known folders: {e}")
             self._known_folders = set()
             self._folder_file_counts = {}
+            self._folder_mtimes = {}
         self._running = True
         self._thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._thread.start()
@@ -46,6 +54,26 @@ class _PollingScanner:
         if self._thread:
             self._thread.join(timeout=5)
 
+    def reconcile(self):
+        """Single pass that reports album folders added, or whose audio file
+        count no longer matches the database, while nothing was watching."""
+        try:
+            counts = self._load_track_counts()
+            self._known_folders = set(counts)
+            self._folder_file_counts = counts
+            self._scan_for_new()
+        except Exception as e:
+            log.error(f"Startup reconciliation failed: {e}")
+
+    def _load_track_counts(self) -> dict[str, int]:
+        from app.database import SessionLocal
+        from app.models import Album
+        db = SessionLocal()
+        try:
+            return {path: count or 0 for path, count in db.query(Album.path, Album.track_count)}
+        finally:
+            db.close()
+
     def _load_known_folders(self) -> set[str]:
         from app.database import SessionLocal
         from app.models import Album
@@ -58,7 +86,7 @@ class _PollingScanner:
     def _poll_loop(self):
         log.info("Polling scanner thread started")
         while self._running:
-            for _ in range(self._POLL_INTERVAL):
+            for _ in range(self._interval):
                 if not self._running:
                     return
                 time.sleep(1)
@@ -71,101 +99,404 @@ class _PollingScanner:
 
     def _has_audio_files(self, path: str) -> bool:
         """Check if a directory directly contains audio files."""
-        return any(
-            os.path.splitext(f)[1].lower() in AUDIO_EXTENSIONS
-            for f in os.listdir(path)
-            if os.path.isfile(os.path.join(path, f))
-        )
+        with os.scandir(path) as it:
+            return any(
+                is_audio_filename(e.name) and e.is_file()
+                for e in it
+            )
 
-    def _count_audio_files(self, folder: str) -> int:
+    def _count_audio_files(self, folder: str, cache: ScanCache) -> int:
         """Count audio files in a folder, including disc subfolders."""
         count = 0
         try:
-            disc_subs = find_disc_subfolders(folder)
+            disc_subs = cache.disc_subs(folder)
             dirs_to_check = [folder]
             if disc_subs:
                 dirs_to_check.extend(disc_subs.values())
             for d in dirs_to_check:
-                if not os.path.isdir(d):
+                try:
+                    with os.scandir(d) as it:
+                        count += sum(1 for e in it if is_audio_filename(e.name) and e.is_file())
+                except (FileNotFoundError, NotADirectoryError):
                     continue
-                for f in os.listdir(d):
-                    if os.path.isfile(os.path.join(d, f)) and os.path.splitext(f)[1].lower() in AUDIO_EXTENSIONS:
-                        count += 1
         except OSError:
             pass
         return count
 
+    def _snapshot_mtimes(self, folder: str) -> dict[str, int]:
+        """Modification times of a folder and its disc-named subfolders."""
+        try:
+            mtimes = {folder: os.stat(folder).st_mtime_ns}
+            with os.scandir(folder) as it:
+                for e in it:
+                    if is_disc_subfolder(e.name) and e.is_dir():
+                        mtimes[e.path] = e.stat().st_mtime_ns
+        except OSError:
+            return {}
+        return mtimes
+
+    def _is_unchanged(self, folder: str) -> bool:
+        """True if no entry was added or removed since the folder was counted.
+
+        Adding or removing a directory entry bumps the directory's mtime, and
+        a new disc subfolder would bump the album folder's own mtime.
+        """
+        mtimes = self._folder_mtimes.get(folder)
+        if not mtimes:
+            return False
+        try:
+            return all(os.stat(p).st_mtime_ns == m for p, m in mtimes.items())
+        except OSError:
+            return False
+
+    def _recount(self, folder: str, cache: ScanCache) -> int:
+        """Count a folder's audio files and remember its mtimes."""
+        # Taken before counting so a change in between is seen next cycle
+        self._folder_mtimes[folder] = self._snapshot_mtimes(folder)
+        count = self._count_audio_files(folder, cache)
+        self._folder_file_counts[folder] = count
+        return count
+
+    def _initial_file_counts(self) -> dict[str, int]:
+        """Audio file counts for all known folders from a single tree walk.
+
+        Files are credited to the known folder they sit in, or to its parent
+        when they sit in a disc subfolder, matching _count_audio_files.
+        """
+        counts = dict.fromkeys(self._known_folders, 0)
+        mtimes: dict[str, dict[str, int]] = {}
+        visited: set[str] = set()
+        stack = [self._watch_path]
+        while stack:
+            root = stack.pop()
+            try:
+                root_mtime = os.stat(root).st_mtime_ns
+                with os.scandir(root) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            audio = 0
+            for e in entries:
+                if e.is_dir():
+                    if not e.name.startswith(".") and (root == self._watch_path or not e.is_symlink()):
+                        stack.append(e.path)
+                elif is_audio_filename(e.name) and e.is_file():
+                    audio += 1
+
+            if root in counts:
+                counts[root] += audio
+                mtimes.setdefault(root, {})[root] = root_mtime
+                visited.add(root)
+            if is_disc_subfolder(os.path.basename(root)):
+                parent = os.path.dirname(root)
+                if parent in counts:
+                    counts[parent] += audio
+                    mtimes.setdefault(parent, {})[root] = root_mtime
+
+        # Known folders the walk didn't reach (outside the watch path,
+        # behind a symlink) are counted directly
+        cache = ScanCache()
+        for folder in self._known_folders - visited:
+            mtimes[folder] = self._snapshot_mtimes(folder)
+            counts[folder] = self._count_audio_files(folder, cache)
+        self._folder_mtimes = mtimes
+        return counts
+
     def _scan_for_new(self):
         if not os.path.isdir(self._watch_path):
             return
 
+        cache = ScanCache()
+
         # Check known folders for file count changes (added/removed tracks)
         for folder in list(self._known_folders):
-            if not os.path.isdir(folder):
+            if self._is_unchanged(folder) or not os.path.isdir(folder):
                 continue
-            current_count = self._count_audio_files(folder)
             prev_count = self._folder_file_counts.get(folder, 0)
+            current_count = self._recount(folder, cache)
             if current_count != prev_count:
                 log.info(f"Audio file count changed in {folder}: {prev_count} -> {current_count}")
-                self._folder_file_counts[folder] = current_count
                 self._callback(folder)
 
-        for entry in os.listdir(self._watch_path):
-            if entry.startswith("."):
+        # Iterative scandir DFS (like os.walk without followlinks): hidden
+        # entries are skipped and the dir/file split comes from readdir.
+        stack = [self._watch_path]
+        while stack:
+            root = stack.pop()
+            # Subtrees of known albums are pruned: the scanner never looks for
+            # albums below an album folder, and changes inside one are caught
+            # by the file count check above.
+            if root in self._known_folders and root != self._watch_path:
+                continue
+            try:
+                with os.scandir(root) as it:
+                    entries = [e for e in it if not e.name.startswith(".")]
+            except OSError:
                 continue
-            entry_path = os.path.join(self._watch_path, entry)
-            if not os.path.isdir(entry_path):
+
+            subdirs = []
+            has_audio = False
+            for e in entries:
+                if e.is_dir():
+                    if root == self._watch_path or not e.is_symlink():
+                        subdirs.append(e)
+                elif not has_audio and is_audio_filename(e.name):
+                    has_audio = True
+
+            if has_audio and root != self._watch_path:
+                # Check if this is a disc subfolder — register parent instead
+                folder_name = os.path.basename(root)
+                if is_disc_subfolder(folder_name):
+                    parent_path = os.path.dirname(root)
+                    if parent_path not in self._known_folders:
+                        disc_subs = cache.disc_subs(parent_path)
+                        if disc_subs:
+                            log.info(f"New multi-disc album detected: {parent_path}")
+                            self._known_folders.add(parent_path)
+                            self._recount(parent_path, cache)
+                            # Mark all disc subfolders as known
+                            for disc_path in disc_subs.values():
+                                self._known_folders.add(disc_path)
+                            self._callback(parent_path)
+                            continue
+                log.info(f"New album folder detected: {root}")
+                self._known_folders.add(root)
+                self._recount(root, cache)
+                self._callback(root)
                 continue
 
-            for root, dirs, files in os.walk(entry_path):
-                dirs[:] = [d for d in dirs if not d.startswith(".")]
+            # Only the subfolders need ordering; reversed so they are
+            # visited in name order
+            subdirs.sort(key=lambda e: e.name, reverse=True)
+            stack.extend(e.path for e in subdirs)
+
+
+class _StabilizationTracker:
+    """Reports a folder once no file events have arrived for it for a while.
+
+    Copying an album produces a burst of events; waiting for them to settle
+    (watch_stabilization_delay) avoids scanning a half-copied folder.
+    """
+
+    def __init__(self, callback: Callable[[str], None]):
+        self._callback = callback
+        self._deadlines: dict[str, float] = {}  # folder -> monotonic time it stabilizes
+        # (deadline, folder), one entry per pending folder. Deadlines only
+        # move later, so an entry may be early but never late; it is pushed
+        # back when popped before its folder's current deadline.
+        self._heap: list[tuple[float, str]] = []
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def notify(self, folder: str):
+        """Record activity in a folder, restarting its quiet period."""
+        deadline = time.monotonic() + settings.watch_stabilization_delay
+        with self._cond:
+            if folder not in self._deadlines:
+                heapq.heappush(self._heap, (deadline, folder))
+                self._cond.notify()
+            self._deadlines[folder] = deadline
+
+    def touch(self, folder: str):
+        """Restart the quiet period of a folder that is already pending."""
+        deadline = time.monotonic() + settings.watch_stabilization_delay
+        with self._cond:
+            if folder in self._deadlines:
+                self._deadlines[folder] = deadline
+
+    def _take_ready(self) -> list[str]:
+        """Wait until at least one folder has stabilized (or stop) and return them."""
+        with self._cond:
+            while self._running:
+                now = time.monotonic()
+                ready = []
+                while self._heap and self._heap[0][0] <= now:
+                    _, folder = heapq.heappop(self._heap)
+                    deadline = self._deadlines[folder]
+                    if deadline > now:
+                        heapq.heappush(self._heap, (deadline, folder))
+                    else:
+                        del self._deadlines[folder]
+                        ready.append(folder)
+                if ready:
+                    return ready
+                # Sleep until the earliest deadline, or until notify()
+                self._cond.wait(self._heap[0][0] - now if self._heap else None)
+        return []
 
-                if root in self._known_folders:
+    def _monitor_loop(self):
+        while self._running:
+            ready = self._take_ready()
+            for folder in ready:
+                if not os.path.isdir(folder):
                     continue
+                log.info(f"Folder stabilized: {folder}")
+                try:
+                    self._callback(folder)
+                except Exception as e:
+                    log.error(f"Watcher callback failed for {folder}: {e}")
+
+
+class MusicFolderHandler(FileSystemEventHandler):
+    """Turns filesystem events on audio files into album folder notifications."""
+
+    def __init__(self, tracker: _StabilizationTracker):
+        super().__init__()
+        self._tracker = tracker
+        self._handlers = {
+            EVENT_TYPE_CREATED: self.on_created,
+            EVENT_TYPE_DELETED: self.on_deleted,
+            EVENT_TYPE_MODIFIED: self.on_modified,
+            EVENT_TYPE_MOVED: self.on_moved,
+        }
+
+    def dispatch(self, event):
+        # Every change inside a folder also produces a directory-modified
+        # event; of the directory events only moves are used, so the rest are
+        # dropped here. The base dispatch would also build its handler table
+        # and call on_any_event for every event.
+        if event.is_directory and event.event_type != EVENT_TYPE_MOVED:
+            return
+        handler = self._handlers.get(event.event_type)
+        if handler:
+            handler(event)
+
+    def on_created(self, event):
+        self._handle_file(event.src_path)
+
+    def on_deleted(self, event):
+        self._handle_file(event.src_path)
 
-                has_audio = any(
-                    os.path.splitext(f)[1].lower() in AUDIO_EXTENSIONS
-                    for f in files
-                    if not f.startswith(".")
-                )
-                if has_audio:
-                    # Check if this is a disc subfolder — register parent instead
-                    folder_name = os.path.basename(root)
-                    if is_disc_subfolder(folder_name):
-                        parent_path = os.path.dirname(root)
-                        if parent_path not in self._known_folders:
-                            disc_subs = find_disc_subfolders(parent_path)
-                            if disc_subs:
-                                log.info(f"New multi-disc album detected: {parent_path}")
-                                self._known_folders.add(parent_path)
-                                self._folder_file_counts[parent_path] = self._count_audio_files(parent_path)
-                                # Mark all disc subfolders as known
-                                for disc_path in disc_subs.values():
-                                    self._known_folders.add(disc_path)
-                                self._callback(parent_path)
-                                continue
-                    log.info(f"New album folder detected: {root}")
-                    self._known_folders.add(root)
-                    self._folder_file_counts[root] = self._count_audio_files(root)
-                    self._callback(root)
+    def on_modified(self, event):
+        # Writes to a file being copied keep its folder from stabilizing, but
+        # don't start a scan on their own (tag writes also modify files)
+        folder, name = os.path.split(event.src_path)
+        if not _should_ignore(name):
+            self._tracker.touch(_album_folder(folder))
+
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._handle_file(event.dest_path)
+            return
+        # A whole album folder renamed or moved into place. Both checks stop
+        # at the first audio file; a multi-disc album only has audio in its
+        # disc subfolders.
+        dest = event.dest_path
+        if _should_ignore(os.path.basename(dest)):
+            return
+        if has_audio_files(dest) or find_disc_subfolders(dest):
+            self._tracker.notify(_album_folder(dest))
+
+    def _handle_file(self, path: str):
+        # The extension test (one rfind and a set lookup) rejects most events
+        # before the basename is split off for the ignore rules
+        if not is_audio_filename(path):
+            return
+        folder, name = os.path.split(path)
+        if not _should_ignore(name):
+            self._tracker.notify(_album_folder(folder))
+
+
+_IGNORED_SUFFIXES = (".tmp", ".part")
+
+
+def _should_ignore(name: str) -> bool:
+    """Hidden files and partial downloads/copies, by basename."""
+    return name.startswith(".") or name.endswith(_IGNORED_SUFFIXES)
+
+
+def _album_folder(folder: str) -> str:
+    """The album folder for a directory, resolving disc subfolders to their parent."""
+    if is_disc_subfolder(os.path.basename(folder)):
+        return os.path.dirname(folder)
+    return folder
+
+
+def _events_supported() -> bool:
+    """Whether native filesystem events can be expected to see library changes.
+
+    Inside a container, changes made on the host through a bind mount don't
+    reliably produce inotify events, so watch_mode "auto" polls there.
+    """
+    return not os.path.exists("/.dockerenv")
 
 
 class FileWatcher:
-    """Monitors music directory for new albums via polling."""
+    """Monitors music directory for new albums.
+
+    Uses native filesystem events (inotify via watchdog) where they are
+    reliable and falls back to polling otherwise; see settings.watch_mode.
+    """
 
     def __init__(self, on_new_folder: Callable[[str], None]):
         self._watch_path = settings.music_dir
         self._on_new_folder = on_new_folder
-        self._poller = _PollingScanner(self._watch_path, on_new_folder)
+        self._observer = None
+        self._tracker: Optional[_StabilizationTracker] = None
+        self._poller: Optional[_PollingScanner] = None
 
     def start(self):
         if not os.path.isdir(self._watch_path):
             log.warning(f"Watch path does not exist: {self._watch_path}")
             return
 
+        mode = settings.watch_mode
+        if mode == "events" or (mode == "auto" and _events_supported()):
+            try:
+                self._start_observer()
+                log.info(f"File watcher started on {self._watch_path} (filesystem events)")
+                # Events only cover changes from now on; catch up on what
+                # happened while the app was down. Started after the observer
+                # so nothing falls in between, and reported through the tracker
+                # so a folder also seen by events (or still being copied) is
+                # reported once, after it settles.
+                reconciler = _PollingScanner(self._watch_path, self._tracker.notify)
+                threading.Thread(target=reconciler.reconcile, daemon=True).start()
+                return
+            except Exception as e:
+                log.warning(f"Filesystem events unavailable ({e}), falling back to polling")
+
+        interval = settings.watch_poll_interval
+        self._poller = _PollingScanner(self._watch_path, self._on_new_folder, interval)
         self._poller.start()
-        log.info(f"File watcher started on {self._watch_path} (polling every {_PollingScanner._POLL_INTERVAL}s)")
+        log.info(f"File watcher started on {self._watch_path} (polling every {interval}s)")
+
+    def _start_observer(self):
+        from watchdog.observers import Observer
+        from watchdog.observers.polling import PollingObserver
+        # watchdog silently substitutes its own (full-stat) polling observer
+        # when no native API is available; ours is cheaper
+        if Observer is PollingObserver:
+            raise RuntimeError("no native filesystem event API")
+
+        tracker = _StabilizationTracker(self._on_new_folder)
+        observer = Observer()
+        observer.schedule(MusicFolderHandler(tracker), self._watch_path, recursive=True)
+        observer.start()  # raises OSError when inotify watches/instances run out
+        tracker.start()
+        self._observer = observer
+        self._tracker = tracker
 
     def stop(self):
-        self._poller.stop()
+        if self._observer:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+        if self._tracker:
+            self._tracker.stop()
+        if self._poller:
+            self._poller.stop()
         log.info("File watcher stopped")
@@ -1,45 +1,114 @@
 import asyncio
-from typing import List, Optional
+import threading
+from typing import Optional
+
+import orjson
 from fastapi import WebSocket
 
 from app.utils.logger import log
 
 
 class NotificationService:
+    # Progress updates are coalesced per album and sent at most this often
+    _PROGRESS_INTERVAL = 0.1  # seconds
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: set[WebSocket] = set()
         self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending_progress: dict[int, dict] = {}  # album_id -> latest progress message
+        self._progress_lock = threading.Lock()
+        # Messages from worker threads, sent in order by a single task
+        self._outbox: Optional[asyncio.Queue] = None
+        # Set when progress becomes pending, so the progress task sleeps otherwise
+        self._progress_ready: Optional[asyncio.Event] = None
+        self._tasks: list[asyncio.Task] = []
 
     def set_loop(self, loop: asyncio.AbstractEventLoop):
-        """Set the event loop for thread-safe broadcasting."""
+        """Set the event loop for thread-safe broadcasting (call from that loop)."""
+        # The instance outlives app restarts; don't leave a second set of tasks running
+        self.close()
         self._loop = loop
+        self._outbox = asyncio.Queue()
+        self._progress_ready = asyncio.Event()
+        self._tasks = [
+            loop.create_task(self._send_loop()),
+            loop.create_task(self._progress_loop()),
+        ]
+
+    def close(self):
+        """Stop the background tasks; broadcasts are dropped until set_loop is called again."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        self._loop = None
+        self._outbox = None
+        self._progress_ready = None
+        with self._progress_lock:
+            self._pending_progress.clear()
+
+    async def _send_loop(self):
+        while True:
+            message = await self._outbox.get()
+            try:
+                await self._broadcast(message)
+            except Exception as e:
+                # Lose this message, not the sender for every later one
+                log.error(f"WebSocket broadcast failed: {e}")
+
+    async def _progress_loop(self):
+        while True:
+            await self._progress_ready.wait()
+            # Updates arriving during the window are coalesced into one send
+            await asyncio.sleep(self._PROGRESS_INTERVAL)
+            self._progress_ready.clear()
+            for message in self._take_progress():
+                self._outbox.put_nowait(message)
+
+    def _take_progress(self) -> list[dict]:
+        with self._progress_lock:
+            pending, self._pending_progress = self._pending_progress, {}
+        return list(pending.values())
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         log.info(f"WebSocket client connected. Total: {len(self.active_connections)}")
 
+    def has_subscribers(self) -> bool:
+        """Whether any client is connected; lets callers skip building messages."""
+        return bool(self.active_connections)
+
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
         log.info(f"WebSocket client disconnected. Total: {len(self.active_connections)}")
 
     async def _broadcast(self, message: dict):
-        dead = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                dead.append(connection)
-        for conn in dead:
-            self.disconnect(conn)
+        # Send to all clients concurrently so one slow client doesn't hold
+        # up the rest; snapshot first since disconnects can happen meanwhile
+        connections = list(self.active_connections)
+        # Serialized once for all clients rather than by send_json per client
+        payload = orjson.dumps(message).decode()
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True,
+        )
+        for conn, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(conn)
 
     def broadcast_sync(self, message: dict):
         """Thread-safe broadcast from sync code (worker threads)."""
-        if not self.active_connections:
+        if not self.has_subscribers():
             return
-        if self._loop and self._loop.is_running():
-            asyncio.run_coroutine_threadsafe(self._broadcast(message), self._loop)
+        loop, outbox = self._loop, self._outbox  # close() may clear them meanwhile
+        if loop and outbox and loop.is_running():
+            # A plain callback per message instead of a coroutine and future.
+            # Queued progress goes first so it never arrives after a later
+            # update for the same album.
+            put = outbox.put_nowait
+            for pending in self._take_progress():
+                loop.call_soon_threadsafe(put, pending)
+            loop.call_soon_threadsafe(put, message)
 
     async def broadcast(self, message: dict):
         """Async broadcast from async code."""
@@ -47,6 +116,8 @@ class NotificationService:
 
     def send_album_update(self, album_id: int, status: str, **kwargs):
         """Send album status update (callable from sync code)."""
+        if not self.has_subscribers():
+            return
         self.broadcast_sync({
             "type": "album_update",
             "album_id": album_id,
@@ -55,16 +126,28 @@ class NotificationService:
         })
 
     def send_progress(self, album_id: int, progress: float, message: str = ""):
-        """Send progress update (callable from sync code)."""
-        self.broadcast_sync({
-            "type": "progress",
-            "album_id": album_id,
-            "progress": progress,
-            "message": message,
-        })
+        """Send progress update (callable from sync code).
+
+        Only the latest update per album within _PROGRESS_INTERVAL is sent.
+        """
+        if not self.has_subscribers():
+            return
+        with self._progress_lock:
+            first = not self._pending_progress
+            self._pending_progress[album_id] = {
+                "type": "progress",
+                "album_id": album_id,
+                "progress": progress,
+                "message": message,
+            }
+        loop, ready = self._loop, self._progress_ready  # close() may clear them meanwhile
+        if first and loop and ready and loop.is_running():
+            loop.call_soon_threadsafe(ready.set)
 
     def send_notification(self, level: str, message: str):
         """Send notification (callable from sync code)."""
+        if not self.has_subscribers():
+            return
         self.broadcast_sync({
             "type": "notification",
             "level": level,
@@ -73,6 +156,8 @@ class NotificationService:
 
     def send_scan_update(self, found: int, message: str = ""):
         """Send scan progress (callable from sync code)."""
+        if not self.has_subscribers():
+            return
         self.broadcast_sync({
             "type": "scan_update",
             "found": found,
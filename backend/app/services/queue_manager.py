@@ -1,7 +1,11 @@
 import threading
 import queue
+from collections import deque
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
 
 from app.services.album_scanner import scan_single_folder
 from app.services.tagging_service import process_album
@@ -29,6 +33,7 @@ class QueueManager:
         self._worker: Optional[threading.Thread] = None
         self._running = False
         self._current_item: Optional[QueueItem] = None
+        self._batch: deque[QueueItem] = deque()  # drained but not yet processed
 
     def start(self):
         self._running = True
@@ -56,9 +61,17 @@ class QueueManager:
         self._queue.put(item)
         log.info(f"Queued album {album_id} (user_initiated={user_initiated}, queue size: {self._queue.qsize()})")
 
+    def enqueue_album_many(self, album_ids: List[int], user_initiated: bool = False):
+        """Add several albums to the tagging queue with a single log line."""
+        if not album_ids:
+            return
+        for aid in album_ids:
+            self._queue.put(QueueItem(album_id=aid, user_initiated=user_initiated))
+        log.info(f"Queued {len(album_ids)} albums (user_initiated={user_initiated}, queue size: {self._queue.qsize()})")
+
     @property
     def queue_size(self) -> int:
-        return self._queue.qsize()
+        return self._queue.qsize() + len(self._batch)
 
     @property
     def is_processing(self) -> bool:
@@ -74,17 +87,46 @@ class QueueManager:
             if item is None:  # sentinel
                 break
 
-            self._current_item = item
+            drained = self._drain(item)
             try:
-                self._process_item(item)
-            except Exception as e:
-                log.error(f"Queue worker error: {e}")
-                self._handle_retry(item)
+                while self._batch and self._running:
+                    item = self._batch.popleft()
+                    self._current_item = item
+                    # One session per item, shared by its status checks and retry update
+                    with SessionLocal() as db:
+                        try:
+                            self._process_item(db, item)
+                        except Exception as e:
+                            log.error(f"Queue worker error: {e}")
+                            db.rollback()
+                            self._handle_retry(db, item)
+                        finally:
+                            self._current_item = None
             finally:
-                self._current_item = None
-                self._queue.task_done()
+                self._batch.clear()
+                for _ in range(drained):
+                    self._queue.task_done()
+
+    def _drain(self, first: QueueItem) -> int:
+        """Move everything queued behind ``first`` into the batch, dropping
+        duplicates. Returns how many items were taken."""
+        rest = []
+        while True:
+            try:
+                rest.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        seen = set()
+        for item in [first, *rest]:
+            if item is None:  # sentinel: stop() is shutting the worker down
+                break
+            key = (item.folder_path, item.album_id, item.release_id, item.user_initiated)
+            if key not in seen:
+                seen.add(key)
+                self._batch.append(item)
+        return 1 + len(rest)
 
-    def _process_item(self, item: QueueItem):
+    def _process_item(self, db: Session, item: QueueItem):
         album_id = item.album_id
 
         # If it's a folder, scan it first
@@ -100,37 +142,28 @@ class QueueManager:
 
         # Don't re-process already tagged albums unless user explicitly triggered it
         if not item.user_initiated:
-            db = SessionLocal()
-            try:
-                album = db.query(Album).filter(Album.id == album_id).first()
-                if album and album.status == "tagged":
-                    log.info(f"Album {album_id} already tagged, skipping auto re-process")
-                    return
-            finally:
-                db.close()
+            if _album_status(db, album_id) == "tagged":
+                log.info(f"Album {album_id} already tagged, skipping auto re-process")
+                return
 
         log.info(f"Processing album {album_id} (attempt {item.retry_count + 1}, user_initiated={item.user_initiated})")
         success = process_album(album_id, release_id=item.release_id, user_initiated=item.user_initiated)
 
         if not success and item.retry_count < MAX_RETRIES - 1:
             # Check if it needs review (don't retry those)
-            db = SessionLocal()
-            try:
-                album = db.query(Album).filter(Album.id == album_id).first()
-                if album and album.status in ("needs_review", "skipped"):
-                    log.info(f"Album {album_id} status is '{album.status}', not retrying")
-                    return
-            finally:
-                db.close()
+            status = _album_status(db, album_id)
+            if status in ("needs_review", "skipped"):
+                log.info(f"Album {album_id} status is '{status}', not retrying")
+                return
 
-            self._handle_retry(QueueItem(
+            self._handle_retry(db, QueueItem(
                 album_id=album_id,
                 release_id=item.release_id,
                 user_initiated=item.user_initiated,
                 retry_count=item.retry_count,
             ))
 
-    def _handle_retry(self, item: QueueItem):
+    def _handle_retry(self, db: Session, item: QueueItem):
         if item.retry_count < MAX_RETRIES - 1:
             item.retry_count += 1
             self._queue.put(item)
@@ -138,17 +171,25 @@ class QueueManager:
 
             # Update retry count in DB
             if item.album_id:
-                db = SessionLocal()
                 try:
-                    album = db.query(Album).filter(Album.id == item.album_id).first()
-                    if album:
-                        album.retry_count = item.retry_count
-                        db.commit()
-                finally:
-                    db.close()
+                    db.execute(
+                        update(Album).where(Album.id == item.album_id)
+                        .values(retry_count=item.retry_count)
+                    )
+                    db.commit()
+                except Exception as e:
+                    db.rollback()
+                    log.error(f"Could not record retry for album {item.album_id}: {e}")
         else:
             log.warning(f"Max retries reached for album {item.album_id}")
 
 
+def _album_status(db: Session, album_id: int) -> Optional[str]:
+    status = db.execute(select(Album.status).where(Album.id == album_id)).scalar_one_or_none()
+    # End the read transaction so a later check sees what process_album committed
+    db.rollback()
+    return status
+
+
 # Singleton instance
 queue_manager = QueueManager()
@@ -1,27 +1,38 @@
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
+from itertools import pairwise
 from typing import Optional
 
+from sqlalchemy import case
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.audio_reader import scan_album_folder, scan_multi_disc_album, find_disc_subfolders
 from app.core.matcher import find_matches, find_matches_by_fingerprint, decide_action, score_release, MatchScore
-from app.core.musicbrainz_client import MBRelease, get_release_details
+from app.core.musicbrainz_client import MBRelease, MBTrack, get_release_details
 from app.core.fingerprint import fingerprint_album, aggregate_release_candidates
 from app.core.tagger import write_tags, TagData
 from app.core.artwork_fetcher import fetch_artwork, save_artwork_to_folder
-from app.core.tag_backup import create_backup, read_full_tags
+from app.core.tag_backup import create_backup
+from app.core.lyrics_client import fetch_lyrics
+from app.core.lyrics_tagger import write_lyrics
+from app.core.replaygain import analyze_album
+from app.core.replaygain_tagger import write_replaygain
 from app.models import Album, Track, MatchCandidate, ActivityLog
-from app.database import SessionLocal
+from app.database import SessionLocal, bulk_insert
 from app.config import settings
 from app.services.notification_service import notifications
 from app.utils.logger import log
 
+# Concurrent per-track tag writes and lyrics lookups
+FILE_WORKERS = 8
+LYRICS_WORKERS = 4  # kept low to stay polite to LRCLIB
+
 
 def _progress(album_id: int, progress: float, message: str):
-    """Send progress update with a small delay to let the event loop flush."""
+    """Send progress update; the notification service queues and delivers it."""
     notifications.send_progress(album_id, progress, message)
-    time.sleep(0.08)  # give the async event loop time to deliver the WS message
 
 
 def process_album(album_id: int, release_id: Optional[str] = None, user_initiated: bool = False) -> bool:
@@ -35,263 +46,282 @@ def process_album(album_id: int, release_id: Optional[str] = None, user_initiate
 
     Returns True if tags were written.
     """
-    db = SessionLocal()
-    try:
-        album = db.query(Album).filter(Album.id == album_id).first()
-        if not album:
-            log.error(f"Album {album_id} not found")
-            return False
-
-        log.info(f"Processing album {album_id}: {album.artist} - {album.album}")
+    # Read settings once so a change made mid-run can't mix old and new values
+    acoustid_key = settings.acoustid_api_key
+    fp_enabled = settings.fingerprint_enabled and bool(acoustid_key)
+    auto_threshold = settings.confidence_auto_threshold
+    auto_tag_on_scan = settings.auto_tag_on_scan
+    do_lyrics = settings.lyrics_enabled and settings.lyrics_auto_fetch
+    do_replaygain = settings.replaygain_enabled and settings.replaygain_auto_calculate
+
+    with SessionLocal() as db:
+        try:
+            album = db.query(Album).filter(Album.id == album_id).first()
+            if not album:
+                log.error("Album %s not found", album_id)
+                return False
 
-        # Update status to matching
-        album.status = "matching"
-        db.commit()
-        notifications.send_album_update(album_id, "matching")
-        _progress(album_id, 0.05, "Reading local files...")
+            log.info("Processing album %s: %s - %s", album_id, album.artist, album.album)
 
-        # Step 1: Read local files (detect multi-disc)
-        disc_subs = find_disc_subfolders(album.path)
-        if disc_subs:
-            album_info = scan_multi_disc_album(album.path, disc_subs)
-        else:
-            album_info = scan_album_folder(album.path)
-        if not album_info:
-            album.status = "failed"
-            album.error_message = "Could not read audio files"
-            db.commit()
-            return False
+            # Every enqueue path already stores "matching", so this only costs a
+            # commit for direct callers; the rest of the run commits once at the end
+            if album.status != "matching":
+                album.status = "matching"
+                db.commit()
+            notifications.send_album_update(album_id, "matching")
+            _progress(album_id, 0.05, "Reading local files...")
 
-        # Step 2: Match on MusicBrainz
-        _progress(album_id, 0.1, "Searching MusicBrainz...")
-        if release_id:
-            # User selected a specific release
-            _progress(album_id, 0.15, f"Fetching release {release_id[:8]}...")
-            selected_release = get_release_details(release_id)
-            if not selected_release:
+            # Step 1: Read local files (detect multi-disc)
+            disc_subs = find_disc_subfolders(album.path)
+            if disc_subs:
+                album_info = scan_multi_disc_album(album.path, disc_subs)
+            else:
+                album_info = scan_album_folder(album.path)
+            if not album_info:
                 album.status = "failed"
-                album.error_message = f"Could not fetch release {release_id}"
+                album.error_message = "Could not read audio files"
                 db.commit()
                 return False
-            matches = []
-            action = "auto_tag"
-        else:
-            # Automatic matching
-            matches = find_matches(album_info, limit=10)
-
-            acoustid_key = settings.acoustid_api_key
-            fp_enabled = settings.fingerprint_enabled and bool(acoustid_key)
-            best_text = matches[0].total_score if matches else 0
-
-            if fp_enabled and not matches:
-                # FALLBACK: text search failed, fingerprint is primary discovery
-                _progress(album_id, 0.15, "Text search failed, fingerprinting tracks...")
-                matches = find_matches_by_fingerprint(album_info, acoustid_key, limit=10)
-            elif fp_enabled and best_text < settings.confidence_auto_threshold:
-                # SUPPLEMENTARY: refine scores with fingerprint data
-                _progress(album_id, 0.15, "Fingerprinting tracks for better matching...")
-                fp_data = fingerprint_album(acoustid_key, album_info.tracks)
-                if fp_data:
-                    fp_matches = aggregate_release_candidates(fp_data)
-                    if fp_matches:
-                        matches = [
-                            score_release(album_info, m.release, fingerprint_matches=fp_matches)
-                            for m in matches
-                        ]
-                        matches.sort(key=lambda m: m.total_score, reverse=True)
-            # else: score already high enough or fingerprinting disabled, skip
-
-            if not matches:
+
+            # Step 2: Match on MusicBrainz
+            _progress(album_id, 0.1, "Searching MusicBrainz...")
+            if release_id:
+                # User selected a specific release
+                _progress(album_id, 0.15, f"Fetching release {release_id[:8]}...")
+                selected_release = get_release_details(release_id)
+                if not selected_release:
+                    album.status = "failed"
+                    album.error_message = f"Could not fetch release {release_id}"
+                    db.commit()
+                    return False
+                matches = []
+                action = "auto_tag"
+            else:
+                # Automatic matching
+                matches = find_matches(album_info, limit=10)
+
+                best_text = matches[0].total_score if matches else 0
+
+                if fp_enabled and not matches:
+                    # FALLBACK: text search failed, fingerprint is primary discovery
+                    _progress(album_id, 0.15, "Text search failed, fingerprinting tracks...")
+                    matches = find_matches_by_fingerprint(album_info, acoustid_key, limit=10)
+                elif fp_enabled and best_text < auto_threshold:
+                    # SUPPLEMENTARY: refine scores with fingerprint data
+                    _progress(album_id, 0.15, "Fingerprinting tracks for better matching...")
+                    fp_data = fingerprint_album(acoustid_key, album_info.tracks)
+                    if fp_data:
+                        fp_matches = aggregate_release_candidates(fp_data)
+                        if fp_matches:
+                            # Every candidate is stored in rank order, so this stays a full sort
+                            matches = sorted(
+                                (score_release(album_info, m.release, fingerprint_matches=fp_matches)
+                                 for m in matches),
+                                key=lambda m: m.total_score, reverse=True,
+                            )
+                # else: score already high enough or fingerprinting disabled, skip
+
+                if not matches:
+                    album.status = "failed"
+                    album.error_message = "No MusicBrainz matches found"
+                    db.add(ActivityLog(album_id=album_id, action="match_failed", details="No results"))
+                    db.commit()
+                    return False
+
+                _progress(album_id, 0.25, f"Found {len(matches)} candidates, scoring...")
+
+                # Step 3: Store candidates in DB
+                _store_candidates(db, album_id, matches)
+
+                best = matches[0]
+                action = decide_action(best.total_score)
+                selected_release = best.release
+
+                # Manual mode: never auto-tag unless user explicitly triggered it
+                if action == "auto_tag" and not user_initiated and not auto_tag_on_scan:
+                    action = "needs_review"
+                    log.info("Manual mode: downgrading auto_tag to needs_review for album %s", album_id)
+
+                _progress(
+                    album_id, 0.3,
+                    f"Best: {selected_release.artist} - {selected_release.title} ({best.total_score:.0f}%)"
+                )
+                log.info("Best match: %s - %s (%.1f/100) -> %s",
+                         selected_release.artist, selected_release.title, best.total_score, action)
+
+            # Step 4: Decide action
+            if action == "needs_review":
+                album.status = "needs_review"
+                album.match_confidence = matches[0].total_score if matches else None
+                db.add(ActivityLog(
+                    album_id=album_id, action="needs_review",
+                    details=f"Best: {selected_release.title} ({matches[0].total_score:.0f}%)" if matches else None,
+                ))
+                db.commit()
+                notifications.send_album_update(
+                    album_id, "needs_review",
+                    confidence=matches[0].total_score if matches else None,
+                    artist=selected_release.artist,
+                    album=selected_release.title,
+                )
+                log.info("Album %s queued for review", album_id)
+                return False
+
+            elif action == "skip":
+                album.status = "skipped"
+                album.match_confidence = matches[0].total_score if matches else None
+                db.add(ActivityLog(
+                    album_id=album_id, action="skipped",
+                    details=f"Low confidence ({matches[0].total_score:.0f}%)" if matches else None,
+                ))
+                db.commit()
+                notifications.send_album_update(album_id, "skipped")
+                log.info("Album %s skipped (low confidence)", album_id)
+                return False
+
+            # auto_tag: write tags and fetch artwork
+            album.match_confidence = matches[0].total_score if matches else 100.0
+
+            # Mark selected candidate
+            if release_id:
+                _mark_selected_candidate(db, album_id, release_id)
+
+            # Step 5: Fetch artwork first so it is embedded by the same file
+            # write as the tags
+            _progress(album_id, 0.32, "Fetching artwork...")
+            artwork = _fetch_artwork(album, selected_release)
+
+            # Step 6: Backup current tags (and cover) before writing
+            _progress(album_id, 0.35, "Backing up current tags...")
+            # Loads the tracks that _write_album_tags then reuses
+            create_backup(db, album.id, "musicbrainz_tag", tracks=album.tracks)
+
+            # Step 6b: Write tags and artwork to files
+            _progress(album_id, 0.4, "Writing tags to files...")
+            success, tracks = _write_album_tags(db, album, selected_release, album_id, artwork)
+            if not success:
                 album.status = "failed"
-                album.error_message = "No MusicBrainz matches found"
-                db.add(ActivityLog(album_id=album_id, action="match_failed", details="No results"))
+                album.error_message = "Failed to write tags"
                 db.commit()
+                notifications.send_album_update(album_id, "failed", error="Failed to write tags")
                 return False
 
-            _progress(album_id, 0.25, f"Found {len(matches)} candidates, scoring...")
+            if artwork:
+                _progress(album_id, 0.75, "Saving artwork...")
+                _save_artwork(album, *artwork)
 
-            # Step 3: Store candidates in DB
-            _store_candidates(db, album_id, matches)
+            if do_lyrics or do_replaygain:
+                # Stat each file once for both steps
+                on_disk = [t for t in tracks if os.path.isfile(t.path)]
 
-            best = matches[0]
-            action = decide_action(best.total_score)
-            selected_release = best.release
+            # Step 7: Auto-fetch lyrics if enabled
+            if do_lyrics:
+                _progress(album_id, 0.88, "Fetching lyrics...")
+                _fetch_lyrics_for_album(db, album, on_disk)
 
-            # Manual mode: never auto-tag unless user explicitly triggered it
-            if action == "auto_tag" and not user_initiated and not settings.auto_tag_on_scan:
-                action = "needs_review"
-                log.info(f"Manual mode: downgrading auto_tag to needs_review for album {album_id}")
+            # Step 8: Auto-calculate ReplayGain if enabled
+            if do_replaygain:
+                _progress(album_id, 0.92, "Calculating ReplayGain...")
+                _calculate_replaygain_for_album(db, album, on_disk)
 
-            _progress(
-                album_id, 0.3,
-                f"Best: {selected_release.artist} - {selected_release.title} ({best.total_score:.0f}%)"
-            )
-            log.info(f"Best match: {selected_release.artist} - {selected_release.title} "
-                      f"({best.total_score:.1f}/100) -> {action}")
+            _progress(album_id, 0.95, "Finalizing...")
+
+            # Update album metadata from MusicBrainz
+            album.artist = selected_release.artist
+            album.album = selected_release.title
+            album.year = selected_release.original_year or selected_release.year
+            album.musicbrainz_release_id = selected_release.release_id
+            album.musicbrainz_release_group_id = selected_release.release_group_id
+            album.status = "tagged"
+            album.error_message = None
 
-        # Step 4: Decide action
-        if action == "needs_review":
-            album.status = "needs_review"
-            album.match_confidence = matches[0].total_score if matches else None
             db.add(ActivityLog(
-                album_id=album_id, action="needs_review",
-                details=f"Best: {selected_release.title} ({matches[0].total_score:.0f}%)" if matches else None,
+                album_id=album_id, action="tagged",
+                details=f"{selected_release.artist} - {selected_release.title}",
             ))
             db.commit()
+
+            log.info("Album %s tagged successfully: %s - %s", album_id, selected_release.artist, selected_release.title)
             notifications.send_album_update(
-                album_id, "needs_review",
-                confidence=matches[0].total_score if matches else None,
+                album_id, "tagged",
                 artist=selected_release.artist,
                 album=selected_release.title,
+                confidence=album.match_confidence,
             )
-            log.info(f"Album {album_id} queued for review")
-            return False
-
-        elif action == "skip":
-            album.status = "skipped"
-            album.match_confidence = matches[0].total_score if matches else None
-            db.add(ActivityLog(
-                album_id=album_id, action="skipped",
-                details=f"Low confidence ({matches[0].total_score:.0f}%)" if matches else None,
-            ))
-            db.commit()
-            notifications.send_album_update(album_id, "skipped")
-            log.info(f"Album {album_id} skipped (low confidence)")
+            notifications.send_notification(
+                "success",
+                f"Tagged: {selected_release.artist} - {selected_release.title}",
+            )
+            return True
+
+        except Exception as e:
+            log.error("Error processing album %s: %s", album_id, e)
+            try:
+                # Drop the half-done run (and its write lock) before recording the failure
+                db.rollback()
+                album = db.query(Album).filter(Album.id == album_id).first()
+                if album:
+                    album.status = "failed"
+                    album.error_message = str(e)[:500]
+                    db.commit()
+                    notifications.send_album_update(album_id, "failed", error=str(e)[:200])
+            except Exception:
+                pass
             return False
 
-        # auto_tag: write tags and fetch artwork
-        album.match_confidence = matches[0].total_score if matches else 100.0
-
-        # Mark selected candidate
-        if release_id:
-            _mark_selected_candidate(db, album_id, release_id)
-
-        # Step 5: Backup current tags before writing
-        _progress(album_id, 0.35, "Backing up current tags...")
-        create_backup(db, album.id, "musicbrainz_tag")
-
-        # Step 5b: Write tags to files
-        _progress(album_id, 0.4, "Writing tags to files...")
-        success = _write_album_tags(db, album, selected_release, album_id)
-        if not success:
-            album.status = "failed"
-            album.error_message = "Failed to write tags"
-            db.commit()
-            notifications.send_album_update(album_id, "failed", error="Failed to write tags")
-            return False
-
-        # Step 6: Backup before artwork, then fetch and save
-        _progress(album_id, 0.75, "Fetching artwork...")
-        create_backup(db, album.id, "artwork")
-        _fetch_and_save_artwork(db, album, selected_release)
-
-        # Step 7: Auto-fetch lyrics if enabled
-        if settings.lyrics_enabled and settings.lyrics_auto_fetch:
-            _progress(album_id, 0.88, "Fetching lyrics...")
-            _fetch_lyrics_for_album(db, album)
-
-        # Step 8: Auto-calculate ReplayGain if enabled
-        if settings.replaygain_enabled and settings.replaygain_auto_calculate:
-            _progress(album_id, 0.92, "Calculating ReplayGain...")
-            _calculate_replaygain_for_album(db, album)
-
-        _progress(album_id, 0.95, "Finalizing...")
-
-        # Update album metadata from MusicBrainz
-        album.artist = selected_release.artist
-        album.album = selected_release.title
-        album.year = selected_release.original_year or selected_release.year
-        album.musicbrainz_release_id = selected_release.release_id
-        album.musicbrainz_release_group_id = selected_release.release_group_id
-        album.status = "tagged"
-        album.error_message = None
-
-        db.add(ActivityLog(
-            album_id=album_id, action="tagged",
-            details=f"{selected_release.artist} - {selected_release.title}",
-        ))
-        db.commit()
-
-        log.info(f"Album {album_id} tagged successfully: {selected_release.artist} - {selected_release.title}")
-        notifications.send_album_update(
-            album_id, "tagged",
-            artist=selected_release.artist,
-            album=selected_release.title,
-            confidence=album.match_confidence,
-        )
-        notifications.send_notification(
-            "success",
-            f"Tagged: {selected_release.artist} - {selected_release.title}",
-        )
-        return True
-
-    except Exception as e:
-        log.error(f"Error processing album {album_id}: {e}")
-        try:
-            album = db.query(Album).filter(Album.id == album_id).first()
-            if album:
-                album.status = "failed"
-                album.error_message = str(e)[:500]
-                db.commit()
-                notifications.send_album_update(album_id, "failed", error=str(e)[:200])
-        except Exception:
-            pass
-        return False
-    finally:
-        db.close()
-
 
 def _store_candidates(db: Session, album_id: int, matches: list[MatchScore]):
     """Store match candidates in the database."""
-    # Remove old candidates
-    db.query(MatchCandidate).filter(MatchCandidate.album_id == album_id).delete()
+    # Remove old candidates; none are loaded in this session, so skip syncing it
+    db.query(MatchCandidate).filter(MatchCandidate.album_id == album_id).delete(synchronize_session=False)
 
-    for i, match in enumerate(matches):
-        r = match.release
-        candidate = MatchCandidate(
+    # Plain rows through one executemany instead of an ORM object per candidate
+    rows = [
+        dict(
             album_id=album_id,
-            musicbrainz_release_id=r.release_id,
-            confidence=match.total_score,
-            artist=r.artist,
-            album=r.title,
-            year=r.year,
-            original_year=r.original_year,
-            track_count=r.track_count,
-            country=r.country,
-            media=r.media,
-            label=r.label,
-            barcode=r.barcode,
+            musicbrainz_release_id=m.release.release_id,
+            confidence=m.total_score,
+            artist=m.release.artist,
+            album=m.release.title,
+            year=m.release.year,
+            original_year=m.release.original_year,
+            track_count=m.release.track_count,
+            country=m.release.country,
+            media=m.release.media,
+            label=m.release.label,
+            barcode=m.release.barcode,
             is_selected=(i == 0),
         )
-        db.add(candidate)
-    db.flush()
+        for i, m in enumerate(matches)
+    ]
+    bulk_insert(db, MatchCandidate, rows)
 
 
 def _mark_selected_candidate(db: Session, album_id: int, release_id: str):
     """Mark a specific candidate as selected."""
+    # One UPDATE: select the matching release, clear the rest
     db.query(MatchCandidate).filter(
         MatchCandidate.album_id == album_id
-    ).update({"is_selected": False})
-
-    db.query(MatchCandidate).filter(
-        MatchCandidate.album_id == album_id,
-        MatchCandidate.musicbrainz_release_id == release_id,
-    ).update({"is_selected": True})
-    db.flush()
+    ).update(
+        {"is_selected": case((MatchCandidate.musicbrainz_release_id == release_id, True), else_=False)},
+        synchronize_session=False,
+    )
 
 
-def _write_album_tags(db: Session, album: Album, release: MBRelease, album_id: int = 0) -> bool:
-    """Write tags to all tracks in the album."""
-    tracks = db.query(Track).filter(Track.album_id == album.id).order_by(
-        Track.disc_number, Track.track_number
-    ).all()
+def _write_album_tags(
+    db: Session, album: Album, release: MBRelease, album_id: int = 0,
+    artwork: Optional[tuple[bytes, str]] = None,
+) -> tuple[bool, list[Track]]:
+    """Write tags (and ``artwork`` as (image_data, mime), if given) to all
+    tracks in the album; returns (any written, the album's tracks)."""
+    # Same order as ORDER BY disc_number, track_number (NULLs first)
+    tracks = sorted(album.tracks, key=lambda t: (
+        t.disc_number is not None, t.disc_number or 0,
+        t.track_number is not None, t.track_number or 0,
+    ))
 
-    # Build MB lookup by (disc_number, disc_position)
-    mb_by_disc: dict[tuple[int, int], 'MBTrack'] = {}
-    for mt in release.tracks:
-        if mt.disc_position > 0:
-            mb_by_disc[(mt.disc_number, mt.disc_position)] = mt
-    mb_flat = sorted(release.tracks, key=lambda t: t.position)
+    # MB lookup by (disc_number, disc_position) and flat position order
+    mb_by_disc, mb_flat = release.track_index
 
     year = release.original_year or release.year
 
@@ -304,13 +334,30 @@ def _write_album_tags(db: Session, album: Album, release: MBRelease, album_id: i
     # can't be trusted (they may reflect a previous multi-disc tagging).
     # Use flat sequential matching sorted by file path.
     use_flat_only = local_is_single_disc and mb_is_multi_disc
-    if use_flat_only:
+    # Tracks usually arrive in path order already; only sort when they don't
+    if use_flat_only and any(prev.path > cur.path for prev, cur in pairwise(tracks)):
         tracks = sorted(tracks, key=lambda t: t.path)
 
     disc_total = release.disc_count if mb_is_multi_disc and not local_is_single_disc else None
     total = len(tracks)
 
-    success_count = 0
+    # Release-wide fields, copied into each track's TagData
+    base_tags = TagData(
+        artist=release.artist,
+        album_artist=release.artist,
+        album=release.title,
+        year=year,
+        genre=release.genres[0].title() if release.genres else None,
+        label=release.label,
+        country=release.country,
+        disc_total=disc_total,
+        musicbrainz_release_id=release.release_id,
+    )
+    if artwork:
+        base_tags.cover_data, base_tags.cover_mime = artwork
+
+    # Build every track's tags first; the file writes then run in parallel
+    planned: list[tuple[Optional[MBTrack], TagData]] = []
     for i, track in enumerate(tracks):
         disc_num = track.disc_number or 1
 
@@ -328,29 +375,16 @@ def _write_album_tags(db: Session, album: Album, release: MBRelease, album_id: i
             elif i < len(mb_flat):
                 mb_track = mb_flat[i]
 
-        if album_id and total > 0:
-            pct = 0.4 + (i / total) * 0.3  # progress 0.4 -> 0.7
-            title_preview = mb_track.title if mb_track else track.title
-            _progress(album_id, pct, f"Writing track {i+1}/{total}: {title_preview}")
-
         # Per-disc track_total
         if use_flat_only:
             track_total = release.track_count
         else:
             track_total = release.disc_track_counts.get(disc_num, release.track_count)
 
-        tag_data = TagData(
-            artist=release.artist,
-            album_artist=release.artist,
-            album=release.title,
-            year=year,
-            genre=release.genres[0].title() if release.genres else None,
-            label=release.label,
-            country=release.country,
+        tag_data = replace(
+            base_tags,
             track_total=track_total,
             disc_number=1 if use_flat_only else disc_num,
-            disc_total=disc_total,
-            musicbrainz_release_id=release.release_id,
         )
 
         if mb_track:
@@ -361,26 +395,79 @@ def _write_album_tags(db: Session, album: Album, release: MBRelease, album_id: i
             else:
                 tag_data.track_number = mb_track.disc_position if mb_track.disc_position > 0 else mb_track.position
 
-        if write_tags(track.path, tag_data):
-            if mb_track:
-                track.title = mb_track.title
-                track.musicbrainz_recording_id = mb_track.recording_id
-            track.artist = release.artist
-            track.track_number = tag_data.track_number
-            track.disc_number = tag_data.disc_number
-            track.status = "tagged"
+        planned.append((mb_track, tag_data))
+
+    written = [False] * total
+    if total:
+        # Each track is its own file; results and progress are handled here
+        # on the calling thread as the writes finish
+        with ThreadPoolExecutor(max_workers=min(FILE_WORKERS, total)) as pool:
+            futures = {
+                pool.submit(write_tags, track.path, tag_data): i
+                for i, (track, (_, tag_data)) in enumerate(zip(tracks, planned))
+            }
+            # At most ~10 progress updates per album, whatever its size
+            progress_step = max(1, -(-total // 10))  # ceiling division
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                written[i] = future.result()
+                if (done % progress_step == 0 or done == total) and album_id and notifications.has_subscribers():
+                    pct = 0.4 + (done / total) * 0.3  # progress 0.4 -> 0.7
+                    mb_track = planned[i][0]
+                    title_preview = mb_track.title if mb_track else tracks[i].title
+                    _progress(album_id, pct, f"Writing track {done}/{total}: {title_preview}")
+
+    success_count = 0
+    updates: list[dict] = []
+    for track, (mb_track, tag_data), ok in zip(tracks, planned, written):
+        # Every mapping carries the same keys so they go out as one executemany
+        if ok:
+            updates.append(dict(
+                id=track.id,
+                title=mb_track.title if mb_track else track.title,
+                musicbrainz_recording_id=mb_track.recording_id if mb_track else track.musicbrainz_recording_id,
+                artist=release.artist,
+                track_number=tag_data.track_number,
+                disc_number=tag_data.disc_number,
+                status="tagged",
+                error_message=track.error_message,
+            ))
             success_count += 1
         else:
-            track.status = "failed"
-            track.error_message = "Failed to write tags"
+            updates.append(dict(
+                id=track.id,
+                title=track.title,
+                musicbrainz_recording_id=track.musicbrainz_recording_id,
+                artist=track.artist,
+                track_number=track.track_number,
+                disc_number=track.disc_number,
+                status="failed",
+                error_message="Failed to write tags",
+            ))
+
+    _bulk_update_tracks(db, list(zip(tracks, updates)))
+    log.info("Tags written to %d/%d tracks", success_count, len(tracks))
+    return success_count > 0, tracks
+
 
-    db.flush()
-    log.info(f"Tags written to {success_count}/{len(tracks)} tracks")
-    return success_count > 0
+def _bulk_update_tracks(db: Session, changes: list[tuple[Track, dict]]):
+    """Apply per-track column values with one executemany UPDATE.
+
+    Each dict must carry the track's ``id``; dicts with the same keys are
+    batched together.
+    """
+    if not changes:
+        return
+    db.bulk_update_mappings(Track, [values for _, values in changes])
+    # The bulk update bypasses the loaded instances; copy the new values
+    # onto them as already persisted so later steps can keep using them
+    for track, values in changes:
+        for key, value in values.items():
+            set_committed_value(track, key, value)
 
 
-def _fetch_and_save_artwork(db: Session, album: Album, release: MBRelease):
-    """Fetch artwork and embed in files + save to folder."""
+def _fetch_artwork(album: Album, release: MBRelease) -> Optional[tuple[bytes, str]]:
+    """Fetch the release's artwork as (image_data, mime)."""
     result = fetch_artwork(
         folder_path=album.path,
         artist=release.artist,
@@ -388,96 +475,81 @@ def _fetch_and_save_artwork(db: Session, album: Album, release: MBRelease):
         musicbrainz_release_id=release.release_id,
         musicbrainz_release_group_id=release.release_group_id or "",
     )
-
     if not result:
-        log.warning(f"No artwork found for album {album.id}")
-        return
+        log.warning("No artwork found for album %s", album.id)
+    return result
 
-    image_data, mime = result
 
-    # Save to folder
+def _save_artwork(album: Album, image_data: bytes, mime: str):
+    """Save artwork to the album folder."""
     saved_path = save_artwork_to_folder(album.path, image_data, mime)
     if saved_path:
         album.cover_path = saved_path
 
-    # Embed in all tracks (read-merge-write to preserve existing tags)
-    tracks = db.query(Track).filter(Track.album_id == album.id).all()
-    embedded = 0
-    for track in tracks:
-        existing = read_full_tags(track.path)
-        if existing:
-            existing.cover_data = image_data
-            existing.cover_mime = mime
-            if write_tags(track.path, existing):
-                embedded += 1
-        else:
-            # Fallback: write cover only (will clear other tags)
-            tag_data = TagData(cover_data=image_data, cover_mime=mime)
-            if write_tags(track.path, tag_data):
-                embedded += 1
-
-    log.info(f"Artwork embedded in {embedded}/{len(tracks)} tracks")
-
 
-def _fetch_lyrics_for_album(db: Session, album: Album):
-    """Auto-fetch lyrics for all tracks during tagging pipeline."""
+def _fetch_lyrics_for_album(db: Session, album: Album, tracks: list[Track]):
+    """Auto-fetch lyrics during tagging pipeline for tracks whose files exist."""
     try:
-        from app.core.lyrics_client import fetch_lyrics
-        from app.core.lyrics_tagger import write_lyrics
+        album_title = album.album or ""
 
-        tracks = db.query(Track).filter(Track.album_id == album.id).all()
-        found = 0
-        for track in tracks:
-            if not os.path.isfile(track.path):
-                continue
-            duration = track.duration or 0
-            lr = fetch_lyrics(
-                artist=track.artist or album.artist or "",
-                title=track.title or "",
-                album=album.album or "",
-                duration=int(duration),
-            )
+        def fetch_and_write(path: str, artist: str, title: str, duration: int) -> Optional[bool]:
+            """Returns whether the written lyrics are synced, None if none were written."""
+            lr = fetch_lyrics(artist=artist, title=title, album=album_title, duration=duration)
             if lr and (lr.plain_lyrics or lr.synced_lyrics):
-                if write_lyrics(track.path, lr.plain_lyrics, lr.synced_lyrics):
-                    track.has_lyrics = True
-                    track.lyrics_synced = bool(lr.synced_lyrics)
-                    found += 1
-        db.flush()
-        log.info(f"Auto-lyrics: found {found}/{len(tracks)} for album {album.id}")
+                if write_lyrics(path, lr.plain_lyrics, lr.synced_lyrics):
+                    return bool(lr.synced_lyrics)
+            return None
+
+        # Lookups are HTTP round trips, so several run at once. Workers only
+        # get plain values; ORM objects stay on this thread.
+        changes = []
+        if tracks:
+            with ThreadPoolExecutor(max_workers=min(LYRICS_WORKERS, len(tracks))) as pool:
+                results = pool.map(
+                    fetch_and_write,
+                    [t.path for t in tracks],
+                    [t.artist or album.artist or "" for t in tracks],
+                    [t.title or "" for t in tracks],
+                    [int(t.duration or 0) for t in tracks],
+                )
+                for track, synced in zip(tracks, results):
+                    if synced is not None:
+                        changes.append((track, dict(id=track.id, has_lyrics=True, lyrics_synced=synced)))
+        found = len(changes)
+        _bulk_update_tracks(db, changes)
+        log.info("Auto-lyrics: found %d/%d for album %s", found, len(tracks), album.id)
     except Exception as e:
-        log.error(f"Auto-lyrics failed for album {album.id}: {e}")
+        log.error("Auto-lyrics failed for album %s: %s", album.id, e)
 
 
-def _calculate_replaygain_for_album(db: Session, album: Album):
-    """Auto-calculate ReplayGain for all tracks during tagging pipeline."""
+def _calculate_replaygain_for_album(db: Session, album: Album, tracks: list[Track]):
+    """Auto-calculate ReplayGain during tagging pipeline for tracks whose files exist."""
     try:
-        from app.core.replaygain import analyze_album
-        from app.core.replaygain_tagger import write_replaygain
-
-        tracks = db.query(Track).filter(Track.album_id == album.id).all()
-        filepaths = [t.path for t in tracks if os.path.isfile(t.path)]
+        filepaths = [t.path for t in tracks]
         if not filepaths:
             return
 
         rg = analyze_album(filepaths)
         if not rg:
-            log.warning(f"ReplayGain analysis returned no data for album {album.id}")
+            log.warning("ReplayGain analysis returned no data for album %s", album.id)
             return
 
-        path_to_track = {t.path: t for t in tracks}
-        for filepath in filepaths:
-            track_rg = rg.tracks.get(filepath)
+        changes = []
+        for track in tracks:
+            track_rg = rg.tracks.get(track.path)
             if not track_rg:
                 continue
-            if write_replaygain(filepath, track_rg.gain, track_rg.peak, rg.album_gain, rg.album_peak):
-                track = path_to_track.get(filepath)
-                if track:
-                    track.replaygain_track_gain = track_rg.gain
-                    track.replaygain_track_peak = track_rg.peak
+            if write_replaygain(track.path, track_rg.gain, track_rg.peak, rg.album_gain, rg.album_peak):
+                changes.append((track, dict(
+                    id=track.id,
+                    replaygain_track_gain=track_rg.gain,
+                    replaygain_track_peak=track_rg.peak,
+                )))
+        _bulk_update_tracks(db, changes)
 
         album.replaygain_album_gain = rg.album_gain
         album.replaygain_album_peak = rg.album_peak
         db.flush()
-        log.info(f"Auto-ReplayGain: album gain={rg.album_gain} for album {album.id}")
+        log.info("Auto-ReplayGain: album gain=%s for album %s", rg.album_gain, album.id)
     except Exception as e:
-        log.error(f"Auto-ReplayGain failed for album {album.id}: {e}")
+        log.error("Auto-ReplayGain failed for album %s: %s", album.id, e)
@@ -1,5 +1,8 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 from app.config import settings
 
@@ -20,7 +23,14 @@ def setup_logger(name: str = "musictaggerz") -> logging.Logger:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+    # Callers only enqueue the record; a background thread does the formatting
+    # and the (possibly blocking) stdout write
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # flush what's still queued on exit
+    logger.addHandler(QueueHandler(records))
 
     return logger
 